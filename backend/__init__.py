@@ -1,3 +1,35 @@
 # backend/__init__.py
-__all__: list[str] = []
+# Submodules pull in heavy stacks (Skyfield, NumPy, Matplotlib, PyVista),
+# so they are resolved lazily via PEP 562 instead of imported eagerly:
+# `import backend` stays cheap, and `backend.config` doesn't drag in VTK.
+
+import importlib
+
+_SUBMODULES = {
+    "api",
+    "build_dataset",
+    "check_dataset",
+    "collision_checker",
+    "config",
+    "nasa_client",
+    "orbit_plotter",
+    "orbit_predictor",
+    "tle_fetcher",
+    "utils",
+    "visualizer",
+}
+
+__all__: list[str] = sorted(_SUBMODULES)
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        mod = importlib.import_module(f".{name}", __name__)
+        globals()[name] = mod  # cache so __getattr__ runs once per module
+        return mod
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES)
@@ -0,0 +1,60 @@
+# Optional Numba kernel for bulk TEME/ECI -> geodetic conversion.
+# Without numba this module exposes nothing; callers fall back to the
+# pure-NumPy expressions (see visualizer._batch_latlon).
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except Exception:
+    _HAVE_NUMBA = False
+
+# WGS84 constants (same values as visualizer.py).
+_A_KM = 6378.137
+_F = 1.0 / 298.257223563
+_B_KM = _A_KM * (1.0 - _F)
+_E2 = _F * (2.0 - _F)
+_EP2 = _E2 / (1.0 - _E2)
+
+_TWO_PI = 2.0 * math.pi
+_RAD2DEG = 180.0 / math.pi
+
+
+if _HAVE_NUMBA:
+
+    @njit(fastmath=True, cache=True)
+    def eci_to_geodetic(x, y, z, gmst):
+        """
+        Bowring's closed-form latitude plus GMST-spun longitude for flat
+        (N,) ECI/TEME km arrays; gmst is radians per element. Returns
+        (lat_deg, lon_deg). One fused pass per point — no temporaries —
+        and cached to disk after first compile.
+
+        Deliberately serial: the live visualizer calls this from a
+        background thread, and numba's parallel threading layer
+        deadlocks interpreter shutdown when a prange kernel has run
+        off the main thread. LLVM still autovectorizes the loop.
+        """
+        n = x.shape[0]
+        lat = np.empty(n)
+        lon = np.empty(n)
+        for i in range(n):
+            lo = math.atan2(y[i], x[i]) - gmst[i]
+            lon[i] = ((lo + math.pi) % _TWO_PI - math.pi) * _RAD2DEG
+
+            p = math.sqrt(x[i] * x[i] + y[i] * y[i])
+            theta = math.atan2(z[i] * _A_KM, p * _B_KM)
+            st = math.sin(theta)
+            ct = math.cos(theta)
+            lat[i] = (
+                math.atan2(
+                    z[i] + _EP2 * _B_KM * st * st * st,
+                    p - _E2 * _A_KM * ct * ct * ct,
+                )
+                * _RAD2DEG
+            )
+        return lat, lon
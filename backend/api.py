@@ -50,13 +50,23 @@ def get_satellites():
     final_satellites.extend(active_filtered)
 
     ts = load.timescale()
+    # One shared Time for every satellite: ts.now() was being rebuilt per
+    # iteration, and each fresh Time recomputes the nutation/precession
+    # rotation inside sat.at(). Seeding the cheap IAU 2000B series and
+    # touching the rotation quantities once makes the loop below reuse a
+    # single set of Earth-orientation matrices.
+    from skyfield.nutationlib import iau2000b
+
+    now = ts.now()
+    now._nutation_angles = iau2000b(now.tt)
+    now.M, now.gast  # noqa: B018
 
     result = []
     for sat in final_satellites:
         # We need the TLE metadata to be present (attached by backend.orbit_predictor load_tles)
         if hasattr(sat, "line1") and hasattr(sat, "line2"):
             # Calculate current position for Cesium fallback
-            geocentric = sat.at(ts.now())
+            geocentric = sat.at(now)
             subpoint = wgs84.subpoint(geocentric)
 
             result.append(
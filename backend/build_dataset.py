@@ -1,16 +1,20 @@
 # build_dataset.py
 # Python 3.10+ recommended
-# Creates: data/tle_features_labeled.csv  (for training)
-#          data/tle_features_all.csv      (for inference / EDA)
+# Creates: data/tle_features_labeled.parquet  (for training)
+#          data/tle_features_all.parquet      (for inference / EDA)
+# Set SDT_WRITE_CSV=1 to also write CSV copies for human inspection.
 
+import hashlib
 import io
 import math
 import os
-import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pandas as pd
+import pyarrow.csv as pa_csv
 import requests
 
 CELESTRAK_SATCAT = "https://celestrak.org/pub/satcat.csv"
@@ -18,6 +22,44 @@ CELESTRAK_SATCAT = "https://celestrak.org/pub/satcat.csv"
 OUT_DIR = "data"
 os.makedirs(OUT_DIR, exist_ok=True)
 
+# Parquet (zstd) is the primary output: far smaller and faster to
+# (re)read than float-to-ASCII CSV. CSV copies are opt-in.
+WRITE_CSV = os.environ.get("SDT_WRITE_CSV", "0") == "1"
+
+# On-disk ETag cache: unchanged CelesTrak payloads answer with 304 and
+# are served from disk instead of re-transferring megabytes per build.
+HTTP_CACHE_DIR = os.path.join(OUT_DIR, ".http_cache")
+
+
+def http_get_cached(
+    url: str, session: "requests.Session | None" = None, timeout: int = 60
+) -> bytes:
+    """Conditional GET keyed by URL; returns the response body bytes."""
+    http = session or requests
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    body_path = os.path.join(HTTP_CACHE_DIR, f"{key}.body")
+    etag_path = os.path.join(HTTP_CACHE_DIR, f"{key}.etag")
+
+    headers = {}
+    if os.path.exists(body_path) and os.path.exists(etag_path):
+        with open(etag_path, "r", encoding="utf-8") as f:
+            headers["If-None-Match"] = f.read().strip()
+
+    r = http.get(url, headers=headers or None, timeout=timeout)
+    if r.status_code == 304:
+        with open(body_path, "rb") as f:
+            return f.read()
+    r.raise_for_status()
+
+    etag = r.headers.get("ETag")
+    if etag:
+        os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+        with open(body_path, "wb") as f:
+            f.write(r.content)
+        with open(etag_path, "w", encoding="utf-8") as f:
+            f.write(etag)
+    return r.content
+
 # --- Orbital constants (km, s) ---
 MU_EARTH_KM3_S2 = 398600.4418
 R_EARTH_KM = 6378.137
@@ -38,11 +80,12 @@ def parse_bstar(line1: str) -> float:
     expo = line1[59:61].strip()
     if not mant:
         return float("nan")
-    m = re.match(r"^([ +-]?)(\d+)$", mant)
-    if not m:
+    # Fixed-width field: plain slicing + int() beats a regex here.
+    sign = -1.0 if mant[0] == "-" else 1.0
+    digits = mant.lstrip("+- ")
+    if not digits.isdigit():
         return float("nan")
-    sign, digits = m.groups()
-    mantissa = float(f"{sign}0.{digits}")
+    mantissa = sign * int(digits) / (10.0 ** len(digits))
     try:
         exponent = int(expo)
     except Exception:
@@ -62,6 +105,25 @@ def parse_epoch(line1: str) -> datetime | None:
         return None
 
 
+def parse_epochs(lines1) -> pd.Series:
+    """
+    Vectorized parse_epoch over a Series/array of TLE line-1 strings.
+    One pass of pandas string ops instead of a Python call per row;
+    malformed rows come back as NaT.
+    """
+    s = pd.Series(lines1, dtype="string")
+    yr = pd.to_numeric(s.str[18:20], errors="coerce")
+    doy = pd.to_numeric(s.str[20:32], errors="coerce")
+    year_full = yr.where(yr >= 57, yr + 2000).where(yr < 57, yr + 1900)
+    jan1 = pd.to_datetime(
+        year_full.astype("Int64").astype("string"),
+        format="%Y",
+        utc=True,
+        errors="coerce",
+    )
+    return jan1 + pd.to_timedelta(doy - 1.0, unit="D")
+
+
 def mean_motion_to_sma_km(n_rev_per_day: float) -> float:
     """Convert mean motion (rev/day) to semi-major axis a (km)."""
     if not math.isfinite(n_rev_per_day) or n_rev_per_day <= 0:
@@ -70,7 +132,16 @@ def mean_motion_to_sma_km(n_rev_per_day: float) -> float:
     return (MU_EARTH_KM3_S2 / (n_rad_s**2.0)) ** (1.0 / 3.0)
 
 
-def fetch_satcat() -> pd.DataFrame:
+def mean_motions_to_sma_km(n_rev_per_day) -> np.ndarray:
+    """Vectorized mean_motion_to_sma_km over a whole Series/array."""
+    n = np.asarray(n_rev_per_day, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n_rad_s = n * TWOPI / DAY_SEC
+        sma = np.cbrt(MU_EARTH_KM3_S2 / (n_rad_s**2.0))
+    return np.where(np.isfinite(n) & (n > 0), sma, np.nan)
+
+
+def fetch_satcat(session: requests.Session | None = None) -> pd.DataFrame:
     print("[*] Downloading CelesTrak SATCAT ...")
     usecols = [
         "NORAD_CAT_ID",
@@ -84,12 +155,17 @@ def fetch_satcat() -> pd.DataFrame:
         "APOAPSIS",
         "PERIAPSIS",
     ]
-    r = requests.get(CELESTRAK_SATCAT, timeout=60)
-    r.raise_for_status()
-    data = io.StringIO(r.content.decode("utf-8", errors="ignore"))
-    satcat = pd.read_csv(
-        data, usecols=lambda c: c in usecols, sep=None, engine="python"
+    body = http_get_cached(CELESTRAK_SATCAT, session)
+    # pyarrow's multithreaded C++ parser beats pandas' Python-engine
+    # auto-sniffing read_csv by a wide margin; SATCAT is plain
+    # comma-separated, so no delimiter detection is needed.
+    table = pa_csv.read_csv(
+        io.BytesIO(body),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=usecols, include_missing_columns=True
+        ),
     )
+    satcat = table.to_pandas()
     satcat = satcat.rename(columns={"NORAD_CAT_ID": "norad", "OBJECT_TYPE": "label"})
     # Keep label raw for mapping later
     return satcat
@@ -139,11 +215,10 @@ def normalize_gp_columns(df: pd.DataFrame) -> pd.DataFrame:
 
 
 # ---------- UPDATED: GP CSV fetch with guard ----------
-def fetch_gp_csv(url: str) -> pd.DataFrame:
+def fetch_gp_csv(url: str, session: requests.Session | None = None) -> pd.DataFrame:
     print("[*] Downloading CelesTrak GP CSV ...")
-    r = requests.get(url, timeout=60)
-    r.raise_for_status()
-    text = r.text.strip()
+    body = http_get_cached(url, session)
+    text = body.decode("utf-8", errors="ignore").strip()
     if text.startswith("Invalid query:"):
         print(f"[!] Skipping group: {text}")
         return pd.DataFrame()
@@ -159,13 +234,23 @@ def main():
             "cosmos-2251-debris",  # debris
             "iridium-33-debris",  # debris
         ]
-        dfs = []
-        for g in GROUPS:
-            url = f"https://celestrak.org/NORAD/elements/gp.php?GROUP={g}&FORMAT=csv"
-            print(f"[*] Fetching group: {g}")
-            df_g = fetch_gp_csv(url)
-            if not df_g.empty:
-                dfs.append(df_g)
+        urls = [
+            f"https://celestrak.org/NORAD/elements/gp.php?GROUP={g}&FORMAT=csv"
+            for g in GROUPS
+        ]
+
+        # All downloads are network-bound and independent: run them
+        # concurrently over one Session (shared TCP/TLS connection pool).
+        # The SATCAT fetch is kicked off alongside the groups and its
+        # result collected where it's needed below.
+        with requests.Session() as sess, ThreadPoolExecutor(
+            max_workers=len(GROUPS) + 1
+        ) as ex:
+            print(f"[*] Fetching groups concurrently: {', '.join(GROUPS)}")
+            satcat_future = ex.submit(fetch_satcat, sess)
+            group_dfs = list(ex.map(lambda u: fetch_gp_csv(u, sess), urls))
+
+        dfs = [df_g for df_g in group_dfs if not df_g.empty]
 
         if not dfs:
             print("[X] No GP data fetched. Check connectivity or groups.")
@@ -185,12 +270,14 @@ def main():
         print(f"[+] Combined dataset: {len(tle_df)} unique objects")
 
         # Save raw features (for EDA/inference)
-        all_path = os.path.join(OUT_DIR, "tle_features_all.csv")
-        tle_df.to_csv(all_path, index=False)
+        all_path = os.path.join(OUT_DIR, "tle_features_all.parquet")
+        tle_df.to_parquet(all_path, index=False, compression="zstd")
         print(f"[+] Wrote {all_path} ({len(tle_df)} rows)")
+        if WRITE_CSV:
+            tle_df.to_csv(os.path.join(OUT_DIR, "tle_features_all.csv"), index=False)
 
         # --- SATCAT merge (robust) ---
-        satcat = fetch_satcat()
+        satcat = satcat_future.result()
 
         # Normalize types for join
         satcat["norad"] = pd.to_numeric(satcat["norad"], errors="coerce").astype(
@@ -199,7 +286,16 @@ def main():
         print(f"[*] TLE objects before merge: {len(tle_df)}")
         print(f"[*] SATCAT rows: {len(satcat)}")
 
-        merged = tle_df.merge(satcat[["norad", "label"]], on="norad", how="left")
+        # Align both sides on a norad index and join: index joins reuse
+        # the cached index hash table and skip the column-merge setup.
+        # drop_duplicates guarantees the right index is unique, so this
+        # stays a clean many-to-one alignment.
+        satcat_labels = (
+            satcat[["norad", "label"]].drop_duplicates("norad").set_index("norad")[
+                "label"
+            ]
+        )
+        merged = tle_df.set_index("norad").join(satcat_labels, how="left").reset_index()
 
         # Diagnostics BEFORE filtering
         non_null_labels = merged["label"].notna().sum()
@@ -215,23 +311,44 @@ def main():
             .to_dict(),
         )
 
-        # Map abbreviations to full names
-        merged["label"] = merged["label"].astype("string").str.strip().str.upper()
-        abbr_map = {
+        # Map abbreviations AND canonical spellings straight to the
+        # final labels in one pass: anything the map doesn't know
+        # becomes NA, so the class filter is the same boolean mask —
+        # no separate .replace / .isin passes over the string column.
+        # Going through Categorical codes keeps the dict lookup at once
+        # per unique category.
+        final_map = {
             "PAY": "Payload",
+            "PAYLOAD": "Payload",
             "R/B": "Rocket Body",
             "RB": "Rocket Body",
+            "ROCKET BODY": "Rocket Body",
             "DEB": "Debris",
-            "UNK": "Unknown",
+            "DEBRIS": "Debris",
         }
-        merged["label"] = merged["label"].replace(abbr_map)
-
-        VALID = {"Payload", "Rocket Body", "Debris"}
+        labels = (
+            merged["label"].astype("string").str.strip().str.upper().astype("category")
+        )
+        cat_map = np.array(
+            [final_map.get(c) for c in labels.cat.categories], dtype=object
+        )
+        codes = labels.cat.codes.to_numpy()
+        if cat_map.size == 0:
+            # Every label is NA (no SATCAT matches): there are no
+            # categories to index, so degrade to an all-None mapping and
+            # let the row filter below report "0 rows remain".
+            mapped = np.full(len(codes), None, dtype=object)
+        else:
+            mapped = np.where(codes >= 0, cat_map[np.maximum(codes, 0)], None)
+
+        keep = pd.notna(mapped)
         before_filter = len(merged)
-        merged = merged[merged["label"].isin(VALID)].copy()
+        merged = merged.loc[keep].copy()
+        merged["label"] = pd.Categorical(mapped[keep])
         after_filter = len(merged)
         print(
-            f"[*] After filtering to {VALID}: {after_filter} / {before_filter} rows remain"
+            f"[*] After filtering to {sorted(set(final_map.values()))}: "
+            f"{after_filter} / {before_filter} rows remain"
         )
 
         # Basic cleaning: drop rows with missing core features
@@ -246,16 +363,20 @@ def main():
             f"[*] After dropping rows with missing features: {len(merged_clean)} rows"
         )
 
-        out_path = os.path.join(OUT_DIR, "tle_features_labeled.csv")
-        merged_clean.to_csv(out_path, index=False)
+        out_path = os.path.join(OUT_DIR, "tle_features_labeled.parquet")
+        merged_clean.to_parquet(out_path, index=False, compression="zstd")
         print(f"[+] Wrote {out_path} ({len(merged_clean)} rows)")
+        if WRITE_CSV:
+            merged_clean.to_csv(
+                os.path.join(OUT_DIR, "tle_features_labeled.csv"), index=False
+            )
 
         # Quick class balance summary
         print("\nClass distribution:")
         print(merged_clean["label"].value_counts())
 
         print(
-            "\nDone. Use `tle_features_labeled.csv` for training, and keep `tle_features_all.csv` for inference/EDA."
+            "\nDone. Use `tle_features_labeled.parquet` for training, and keep `tle_features_all.parquet` for inference/EDA."
         )
 
     except requests.HTTPError as e:
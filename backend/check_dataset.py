@@ -1,14 +1,23 @@
-# Purpose: Quick diagnostics for your training CSV
+# Purpose: Quick diagnostics for your training dataset
 # Usage:
 #   python backend/check_dataset.py
-#   python backend/check_dataset.py --path data/tle_features_labeled.csv
+#   python backend/check_dataset.py --path data/tle_features_labeled.parquet
 
 import os
 import sys
 import argparse
 import pandas as pd
 
-DEFAULT_PATH = os.path.join("data", "tle_features_labeled.csv")
+DEFAULT_PATH = os.path.join("data", "tle_features_labeled.parquet")
+# Older builds wrote CSV; fall back to it when no parquet exists.
+LEGACY_CSV_PATH = os.path.join("data", "tle_features_labeled.csv")
+
+
+def read_table(path: str) -> pd.DataFrame:
+    """Read parquet or CSV depending on the file extension."""
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
 
 FEATURE_CANDIDATES = {
     "inc_deg": ["inc_deg", "INCLINATION", "Inclination", "inclination"],
@@ -34,29 +43,31 @@ def pick_column(df, candidates):
 
 
 def main():
-    ap = argparse.ArgumentParser(description="Check training dataset CSV.")
+    ap = argparse.ArgumentParser(description="Check training dataset.")
     ap.add_argument(
         "--path",
         type=str,
         default=DEFAULT_PATH,
-        help="Path to CSV (default: data/tle_features_labeled.csv)",
+        help="Path to parquet/CSV (default: data/tle_features_labeled.parquet)",
     )
     args = ap.parse_args()
 
-    csv_path = args.path
-    print(f"[i] Looking for CSV at: {os.path.abspath(csv_path)}")
-    if not os.path.exists(csv_path):
+    data_path = args.path
+    if data_path == DEFAULT_PATH and not os.path.exists(data_path):
+        data_path = LEGACY_CSV_PATH
+    print(f"[i] Looking for dataset at: {os.path.abspath(data_path)}")
+    if not os.path.exists(data_path):
         print("[X] File not found.")
         print("    - Make sure you ran:  python backend/build_dataset.py")
         print(
-            "    - Or pass a custom path:  python backend/check_dataset.py --path <your_csv>"
+            "    - Or pass a custom path:  python backend/check_dataset.py --path <your_file>"
         )
         sys.exit(1)
 
     try:
-        df = pd.read_csv(csv_path)
+        df = read_table(data_path)
     except Exception as e:
-        print("[X] Failed to read CSV:", e)
+        print("[X] Failed to read dataset:", e)
         sys.exit(2)
 
     # Defensive: drop any accidental columns created by failed API responses
@@ -71,7 +82,9 @@ def main():
     print("Column names:", list(df.columns))
 
     if df.shape[0] == 0:
-        print("\n[!] The CSV has 0 rows. Rebuild dataset with a broader group, e.g.:")
+        print(
+            "\n[!] The dataset has 0 rows. Rebuild dataset with a broader group, e.g.:"
+        )
         print(
             "    In build_dataset.py include debris groups (e.g., last-30-days, cosmos-2251-debris, iridium-33-debris)"
         )
@@ -1,7 +1,182 @@
 import numpy as np
-from scipy.spatial import KDTree
+from scipy.spatial import cKDTree
+from sgp4.api import SatrecArray
 from skyfield.api import load, EarthSatellite
-from typing import List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
+
+# Numba is optional; without it the NumPy chunked kernel is used.
+try:
+    from numba import njit, prange
+
+    _HAVE_NUMBA = True
+except Exception:
+    _HAVE_NUMBA = False
+
+# Above this satellite count the dense N^2 kernel is slower than a
+# per-timestep KD-Tree query, which only pays for pairs actually close.
+KDTREE_CUTOFF = 512
+
+# Lazily built timescale singleton: load.timescale() re-parses delta-T
+# tables on every call, which is wasteful for repeated collision checks.
+_TS = None
+
+
+def _get_ts():
+    global _TS
+    if _TS is None:
+        _TS = load.timescale()
+    return _TS
+
+# Candidate pairs per fine-phase batch; bounds the (C, 3, T) diff
+# tensor so the working set stays cache-sized.
+PAIR_CHUNK = 16384
+
+
+if _HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _pair_min_kernel(P, ii, jj, out_d, out_t):
+        """
+        Closest approach per candidate pair, fused min+argmin over T.
+        Streams straight out of P with no diff temporaries; NaN steps
+        never win the running minimum (NaN comparisons are False).
+        """
+        T = P.shape[2]
+        for k in prange(len(ii)):
+            i = ii[k]
+            j = jj[k]
+            best = np.inf
+            best_t = 0
+            for t in range(T):
+                dx = P[i, 0, t] - P[j, 0, t]
+                dy = P[i, 1, t] - P[j, 1, t]
+                dz = P[i, 2, t] - P[j, 2, t]
+                d2 = dx * dx + dy * dy + dz * dz
+                if d2 < best:
+                    best = d2
+                    best_t = t
+            out_d[k] = np.sqrt(best)
+            out_t[k] = best_t
+
+
+def _shell_candidates(P: np.ndarray, threshold_km: float) -> np.ndarray:
+    """
+    Broad phase: two satellites whose radial shells [r_min, r_max] are
+    separated by more than threshold_km can never approach within it.
+    Returns candidate index pairs as an (K, 2) array with i < j.
+    """
+    with np.errstate(invalid="ignore"):
+        radius = np.sqrt((P * P).sum(axis=1))  # (N, T)
+    rmin = np.nan_to_num(radius, nan=np.inf).min(axis=1)
+    rmax = np.nan_to_num(radius, nan=-np.inf).max(axis=1)
+
+    order = np.argsort(rmin, kind="stable")
+    rmin_s = rmin[order]
+    rmax_s = rmax[order]
+    n = len(order)
+
+    # Sorted by rmin, each a pairs with the contiguous run of b > a
+    # whose rmin is within reach. searchsorted finds every run end in
+    # one pass, and the pair list is expanded with repeat/arange — no
+    # Python-level tuple building.
+    upper = np.searchsorted(rmin_s, rmax_s + threshold_km, side="right")
+    starts = np.arange(1, n + 1)
+    counts = np.maximum(upper - starts, 0)
+
+    aa = np.repeat(np.arange(n), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    bb = np.repeat(starts, counts) + offsets
+
+    i = order[aa]
+    j = order[bb]
+    return np.column_stack((np.minimum(i, j), np.maximum(i, j))).astype(np.intp)
+
+
+def _find_close_pairs(
+    P: np.ndarray, threshold_km: float
+) -> Dict[Tuple[int, int], Tuple[float, int]]:
+    """
+    Find every satellite pair that comes within threshold_km.
+
+    P is the (N, 3, T) position tensor. Returns {(i, j): (dist_km, t_idx)}
+    with i < j, keeping each pair's closest approach.
+    """
+    N = P.shape[0]
+    T = P.shape[2]
+    hits: Dict[Tuple[int, int], Tuple[float, int]] = {}
+
+    if N > KDTREE_CUTOFF:
+        # Sparse narrow phase: O(T * (N log N + k)) where k = close pairs.
+        for t_idx in range(T):
+            pos_t = P[:, :, t_idx]
+            finite = np.isfinite(pos_t).all(axis=1)
+            idx = np.flatnonzero(finite)
+            if idx.size < 2:
+                continue
+            tree = cKDTree(pos_t[idx])
+            pairs = tree.query_pairs(r=threshold_km, output_type="ndarray")
+            if not len(pairs):
+                continue
+            d = np.linalg.norm(
+                pos_t[idx[pairs[:, 0]]] - pos_t[idx[pairs[:, 1]]], axis=1
+            )
+            for (a, b), dist in zip(pairs, d):
+                key = (int(idx[a]), int(idx[b]))
+                if key not in hits or dist < hits[key][0]:
+                    hits[key] = (float(dist), t_idx)
+        return hits
+
+    # Broad phase: discard pairs whose altitude shells never overlap.
+    cand = _shell_candidates(P, threshold_km)
+
+    if _HAVE_NUMBA and len(cand):
+        # Fused min+argmin kernel: no diff temporaries at all, pairs
+        # split across cores by prange.
+        out_d = np.empty(len(cand), dtype=np.float32)
+        out_t = np.empty(len(cand), dtype=np.int64)
+        _pair_min_kernel(P, cand[:, 0], cand[:, 1], out_d, out_t)
+        for s in np.flatnonzero(out_d < threshold_km):
+            hits[(int(cand[s, 0]), int(cand[s, 1]))] = (
+                float(out_d[s]),
+                int(out_t[s]),
+            )
+        return hits
+
+    # Fine phase: vectorized distances for the surviving pairs only,
+    # processed in chunks so the (C, 3, T) diff tensor stays cache-sized.
+    # Scratch buffers are allocated once for the chunk shape and reused
+    # across iterations; work happens in squared distances, with sqrt
+    # taken only for the pairs that actually hit.
+    T = P.shape[2]
+    thr2 = threshold_km * threshold_km
+    chunk = min(PAIR_CHUNK, len(cand))
+    if chunk:
+        gi = np.empty((chunk, 3, T), dtype=P.dtype)
+        gj = np.empty((chunk, 3, T), dtype=P.dtype)
+
+    for c0 in range(0, len(cand), PAIR_CHUNK):
+        ii = cand[c0 : c0 + PAIR_CHUNK, 0]
+        jj = cand[c0 : c0 + PAIR_CHUNK, 1]
+        C = len(ii)
+        bi, bj = gi[:C], gj[:C]
+        np.take(P, ii, axis=0, out=bi)
+        np.take(P, jj, axis=0, out=bj)
+        np.subtract(bi, bj, out=bi)
+        np.multiply(bi, bi, out=bi)
+        d2 = np.nan_to_num(bi.sum(axis=1), nan=np.inf, copy=False)  # (C, T)
+
+        min_over_t = d2.min(axis=1)
+        argmin_t = d2.argmin(axis=1)
+
+        for s in np.flatnonzero(min_over_t < thr2):
+            hits[(int(ii[s]), int(jj[s]))] = (
+                float(np.sqrt(min_over_t[s])),
+                int(argmin_t[s]),
+            )
+
+    return hits
 
 
 def check_collisions(
@@ -14,16 +189,17 @@ def check_collisions(
     min_confidence: float = 0.0,
 ) -> List[str]:
     """
-    Optimized collision detection using KD-Trees (Spatial Indexing).
-    Complexity: O(T * N log N) instead of O(T * N^2).
+    Optimized collision detection using vectorized NumPy pairwise distances.
+    All N^2 * T arithmetic runs in SIMD-vectorized NumPy instead of Python.
+    Reports each close pair once, at its time of closest approach.
     """
-    ts = load.timescale()
+    ts = _get_ts()
     t0 = ts.now()
     step_days = step_seconds / 86400.0
     n_steps = max(1, (minutes * 60) // step_seconds)
 
-    # Generate time steps
-    times = [t0 + i * step_days for i in range(n_steps)]
+    # One vectorized Time array instead of a list of scalar Times
+    times = ts.tt_jd(t0.tt + np.arange(n_steps) * step_days)
 
     # Filter satellites first
     valid_sats = []
@@ -45,60 +221,48 @@ def check_collisions(
 
     if verbose:
         print(
-            f"[⚡] Running KD-Tree collision check on {len(valid_sats)} satellites over {minutes} mins..."
+            f"[⚡] Running vectorized collision check on {len(valid_sats)} satellites over {minutes} mins..."
         )
 
     alerts = set()  # Use set to avoid duplicate alerts
 
     # ---------------------------------------------------------
-    # OPTIMIZATION: Evaluate positions in batches per time step
+    # OPTIMIZATION: Propagate all satellites and timesteps in one
+    # SatrecArray.sgp4() call — the whole N x T sweep runs inside
+    # sgp4's compiled loop, bypassing Skyfield's per-satellite Time
+    # machinery. TEME coordinates are fine here: pairwise distances
+    # are invariant under the rigid TEME->GCRS rotation.
     # ---------------------------------------------------------
-    for t_idx, t in enumerate(times):
-        # 1. Bulk calculate positions for this timestep
-        positions = []
-        current_sats = []
-
-        for sat in valid_sats:
-            try:
-                # Skyfield position calculation
-                pos = sat.at(t).position.km
-                positions.append(pos)
-                current_sats.append(sat)
-            except Exception:
-                continue
+    err, r, _ = SatrecArray([sat.model for sat in valid_sats]).sgp4(
+        times.whole, times.ut1_fraction
+    )
+    r[err != 0] = np.nan  # (N, T, 3); failed steps never alert
+
+    # float32 halves memory traffic in the distance kernels; its
+    # ~mm-scale precision at orbital radii is ample for a km-scale
+    # threshold.
+    P = np.ascontiguousarray(r.transpose(0, 2, 1), dtype=np.float32)  # (N, 3, T)
+    N = len(valid_sats)
 
-        if len(positions) < 2:
-            continue
-
-        # 2. Build Spatial Index (KD-Tree)
-        tree = KDTree(positions)
-
-        # 3. Query for pairs within threshold
-        # returns set of (i, j) where i < j
-        pairs = tree.query_pairs(r=threshold_km)
-
-        if pairs:
-            timestamp = t.utc_strftime("%H:%M:%S")
-            for i, j in pairs:
-                s1 = current_sats[i]
-                s2 = current_sats[j]
-
-                # Calculate exact distance
-                p1 = np.array(positions[i])
-                p2 = np.array(positions[j])
-                dist = np.linalg.norm(p1 - p2)
-
-                # Format names with ML tags if available
-                def get_label(s):
-                    name = s.name
-                    stype = getattr(s, "pred_type", None)
-                    return f"{name} ({stype})" if stype else name
-
-                alert_msg = (
-                    f"🔴 COLLISION ALERT: {get_label(s1)} ⚔️ {get_label(s2)} "
-                    f"| Dist: {dist:.2f} km | Time: {timestamp}"
-                )
-                alerts.add(alert_msg)
+    # closest approach per close pair: (i, j) -> (dist_km, t_idx)
+    hits = _find_close_pairs(P, float(threshold_km))
+
+    # Format names with ML tags if available
+    def get_label(s):
+        name = s.name
+        stype = getattr(s, "pred_type", None)
+        return f"{name} ({stype})" if stype else name
+
+    for (i, j), (dist, t_idx) in hits.items():
+        timestamp = times[t_idx].utc_strftime("%H:%M:%S")
+        s1 = valid_sats[i]
+        s2 = valid_sats[j]
+
+        alert_msg = (
+            f"🔴 COLLISION ALERT: {get_label(s1)} ⚔️ {get_label(s2)} "
+            f"| Dist: {dist:.2f} km | Time: {timestamp}"
+        )
+        alerts.add(alert_msg)
 
     unique_alerts = sorted(list(alerts))
 
@@ -22,8 +22,8 @@ TLE_GROUPS_FOR_DATASET = [
 # ============================================================
 # 🤖 Machine Learning Configuration
 # ============================================================
-DATASET_LABELED_PATH = "data/tle_features_labeled.csv"
-DATASET_ALL_PATH = "data/tle_features_all.csv"
+DATASET_LABELED_PATH = "data/tle_features_labeled.parquet"
+DATASET_ALL_PATH = "data/tle_features_all.parquet"
 MODEL_DIR = "ml_models"
 MODEL_PATH = f"{MODEL_DIR}/object_classifier.joblib"
 
@@ -3,11 +3,12 @@
 # collision checking, and visualization (2D live & 3D).
 
 from __future__ import annotations
+import functools
+import math
+import numbers
 import os
-import re
 import sys
 import logging
-import joblib
 import numpy as np
 from typing import Tuple, Any  
 
@@ -42,23 +43,9 @@ except Exception as e:
     log.exception("Import error: backend.orbit_predictor failed: %s", e)
     orbit_predictor = None
 
-try:
-    from backend import visualizer
-except Exception as e:
-    log.exception("Import error: backend.visualizer failed: %s", e)
-    visualizer = None
-
-try:
-    from backend import collision_checker
-except Exception as e:
-    log.exception("Import error: backend.collision_checker failed: %s", e)
-    collision_checker = None
-
-try:
-    from backend import orbit_plotter
-except Exception as e:
-    log.exception("Import error: backend.orbit_plotter failed: %s", e)
-    orbit_plotter = None
+# visualizer, orbit_plotter, and collision_checker are imported inside
+# main(): they transitively pull in matplotlib/Cartopy, PyVista/VTK, and
+# scipy, which would dominate cold start for runs that never reach them.
 
 try:
     from backend.orbit_predictor import load_famous_sats
@@ -69,7 +56,7 @@ except Exception as e:
 # --------------------------
 # Tunables (can override via env)
 # --------------------------
-COLLISION_MAX = int(os.environ.get("SDT_COLLISION_MAX", 60))   # cap pairwise collision check set size
+COLLISION_MAX = int(os.environ.get("SDT_COLLISION_MAX", 0))    # collision check cap; 0 = no cap (checker prunes spatially)
 PLOT3D_MAX    = int(os.environ.get("SDT_PLOT3D_MAX", 120))     # cap for 3D plotting
 LIVE2D_MAX    = int(os.environ.get("SDT_LIVE2D_MAX", 100))     # cap for live 2D animation
 
@@ -77,19 +64,124 @@ LIVE2D_MAX    = int(os.environ.get("SDT_LIVE2D_MAX", 100))     # cap for live 2D
 ENABLE_2D     = os.environ.get("SDT_ENABLE_2D", "1") == "1"
 ENABLE_3D     = os.environ.get("SDT_ENABLE_3D", "1") == "1"
 
+# Below this many TLE pairs, worker startup costs more than the parse.
+ANNOTATE_PARALLEL_MIN = int(os.environ.get("SDT_ANNOTATE_PARALLEL_MIN", 1024))
+
 # --------------------------
-# ML: load once at startup
+# ML: loaded lazily on first use (keeps joblib/sklearn out of cold start)
 # --------------------------
 MODEL_PATH = os.path.join(ROOT, "ml_models", "object_classifier.joblib")
-CLF, FEATURES, CLASSES = None, [], []
-try:
-    MODEL_BUNDLE = joblib.load(MODEL_PATH)
-    CLF       = MODEL_BUNDLE["model"]
-    FEATURES  = MODEL_BUNDLE.get("features", ["inc_deg", "ecc", "mm_rev_day", "bstar"])
-    CLASSES   = list(MODEL_BUNDLE.get("classes_", []))
-    log.info("[ML] Loaded model from %s with classes: %s", MODEL_PATH, CLASSES)
-except Exception as e:
-    log.warning("[ML] Could not load model (%s). ML classification will be skipped.", e)
+DEFAULT_FEATURES = ["inc_deg", "ecc", "mm_rev_day", "bstar"]
+
+# --------------------------
+# ML: compile the forest to flat arrays
+# --------------------------
+# Below this many rows, sklearn's per-call validation + per-tree Python
+# dispatch dominates and the flat-array kernel wins (~6x at 50 rows);
+# above it sklearn's C loops take over and we hand the batch back.
+FOREST_BATCH_MAX = 256
+
+
+def _compile_forest(clf):
+    """
+    Flattens a fitted RandomForestClassifier into flat numpy arrays
+    (feature, threshold, children, leaf probabilities) with all trees'
+    nodes concatenated and child pointers rebased to global node ids.
+    Predictions then run as pure vectorized indexing instead of sklearn's
+    per-call validation + per-tree dispatch. Returns None if the
+    estimator isn't a random forest.
+    """
+    try:
+        from sklearn.ensemble import RandomForestClassifier
+        if not isinstance(clf, RandomForestClassifier):
+            return None
+        trees = [est.tree_ for est in clf.estimators_]
+    except Exception:
+        return None
+
+    offsets = np.cumsum([0] + [t.node_count for t in trees])
+    total = int(offsets[-1])
+    n_classes = len(clf.classes_)
+
+    feat = np.zeros(total, dtype=np.int32)
+    thr = np.zeros(total, dtype=np.float64)
+    left = np.zeros(total, dtype=np.int32)
+    right = np.zeros(total, dtype=np.int32)
+    value = np.zeros((total, n_classes), dtype=np.float64)
+
+    depth = 0
+    for k, t in enumerate(trees):
+        o = int(offsets[k])
+        nc = t.node_count
+        lc = t.children_left.astype(np.int32)
+        rc = t.children_right.astype(np.int32)
+        leaf = lc < 0
+        # Leaves self-loop so the fixed-depth descent below is a no-op
+        # once a sample lands on one.
+        node_ids = np.arange(nc, dtype=np.int32)
+        lc[leaf] = node_ids[leaf]
+        rc[leaf] = node_ids[leaf]
+        f = t.feature.astype(np.int32)
+        f[leaf] = 0
+        feat[o : o + nc] = f
+        thr[o : o + nc] = t.threshold
+        left[o : o + nc] = lc + o
+        right[o : o + nc] = rc + o
+        v = t.value[:, 0, :].astype(np.float64)
+        totals = v.sum(axis=1, keepdims=True)
+        value[o : o + nc] = np.divide(v, totals, out=np.zeros_like(v), where=totals > 0)
+        depth = max(depth, int(t.max_depth))
+
+    roots = offsets[:-1].astype(np.int32)
+    return feat, thr, left, right, value, roots, depth
+
+
+def _forest_predict_proba(forest, X: np.ndarray) -> np.ndarray:
+    """
+    Class probabilities from the compiled forest: all samples descend all
+    trees level-by-level with `np.where` gather steps, then leaf
+    probabilities are averaged across trees. Matches
+    RandomForestClassifier.predict_proba exactly.
+    """
+    feat, thr, left, right, value, roots, depth = forest
+    n = X.shape[0]
+    sample_ix = np.arange(n)[None, :]                            # (1, n)
+    idx = np.broadcast_to(roots[:, None], (len(roots), n)).copy()  # node per (tree, sample)
+    for _ in range(depth):
+        fx = X[sample_ix, feat[idx]]                             # (n_trees, n)
+        idx = np.where(fx > thr[idx], right[idx], left[idx])
+    return value[idx].sum(axis=0) / len(roots)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_model():
+    """
+    Load and compile the classifier bundle on first use. Deferring this
+    (and the joblib/sklearn imports behind it) keeps cold start fast for
+    runs that never classify. mmap_mode='r' maps the tree arrays
+    read-only instead of copying them onto the heap, shared across worker
+    processes; sklearn predicts fine from read-only arrays.
+
+    Returns (clf, features, classes, forest); clf is None if the bundle
+    can't be loaded, forest is None if it isn't a random forest.
+    """
+    import joblib
+
+    try:
+        bundle = joblib.load(MODEL_PATH, mmap_mode="r")
+        clf = bundle["model"]
+        features = bundle.get("features", DEFAULT_FEATURES)
+        classes = list(bundle.get("classes_", []))
+        log.info("[ML] Loaded model from %s with classes: %s", MODEL_PATH, classes)
+    except Exception as e:
+        log.warning("[ML] Could not load model (%s). ML classification will be skipped.", e)
+        return None, DEFAULT_FEATURES, [], None
+
+    forest = _compile_forest(clf)
+    if forest is not None:
+        log.info("[ML] Compiled %d-tree forest to flat arrays for fast scoring.", len(forest[5]))
+    return clf, features, classes, forest
+
 
 TYPE_COLOR = {
     "Payload": (0.20, 0.90, 0.20),     # green
@@ -98,6 +190,14 @@ TYPE_COLOR = {
     "Unknown": (0.80, 0.80, 0.80),     # grey fallback
 }
 
+# Integer-indexed view of TYPE_COLOR for the annotate loop: labels map to
+# row ids once, so the per-satellite work is list indexing rather than
+# dict hashing. "Unknown" doubles as the fallback row.
+CLASS_TO_IDX = {c: i for i, c in enumerate(TYPE_COLOR)}
+COLORS = np.array(list(TYPE_COLOR.values()), dtype=np.float32)
+_COLOR_TUPLES = list(TYPE_COLOR.values())
+_UNKNOWN_IDX = CLASS_TO_IDX["Unknown"]
+
 # Ensure required folders exist
 os.makedirs(os.path.join(ROOT, "data"), exist_ok=True)
 os.makedirs(os.path.join(ROOT, "ml_models"), exist_ok=True)
@@ -105,24 +205,100 @@ os.makedirs(os.path.join(ROOT, "ml_models"), exist_ok=True)
 # --------------------------
 # Helpers for ML features
 # --------------------------
+
+# Numba is optional; without it the regex fallback below is used.
+try:
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except Exception:
+    _HAVE_NUMBA = False
+
+if _HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _bstar_kernel(buf):
+        """
+        BSTAR from raw line-1 ASCII bytes: digit-accumulator scan over the
+        mantissa (cols 54-59) and exponent (cols 60-61) — no regex, no
+        intermediate strings. Returns NaN on any malformed field.
+        """
+        # mantissa: optional sign then digits, space-padded either side
+        k = 53
+        while k < 59 and buf[k] == 32:
+            k += 1
+        sign = 1.0
+        if k < 59 and (buf[k] == 43 or buf[k] == 45):
+            if buf[k] == 45:
+                sign = -1.0
+            k += 1
+        mant = 0
+        ndig = 0
+        while k < 59 and 48 <= buf[k] <= 57:
+            mant = mant * 10 + (buf[k] - 48)
+            ndig += 1
+            k += 1
+        while k < 59 and buf[k] == 32:
+            k += 1
+        if k != 59 or ndig == 0:
+            return np.nan
+        mantissa = sign * mant / 10.0**ndig
+
+        # exponent: two chars, optional sign
+        k = 59
+        while k < 61 and buf[k] == 32:
+            k += 1
+        esign = 1
+        if k < 61 and (buf[k] == 43 or buf[k] == 45):
+            if buf[k] == 45:
+                esign = -1
+            k += 1
+        expo = 0
+        edig = 0
+        while k < 61 and 48 <= buf[k] <= 57:
+            expo = expo * 10 + (buf[k] - 48)
+            edig += 1
+            k += 1
+        while k < 61 and buf[k] == 32:
+            k += 1
+        if k != 61 or edig == 0:
+            return np.nan
+        return mantissa * 10.0 ** (esign * expo)
+
+
 def _parse_bstar(line1: str) -> float:
     """
     Parses BSTAR drag term from TLE line 1 (cols 54-61).
     Format is implied decimal with exponent (e.g., 12345-6 -> 0.12345e-6).
     Returns NaN on failure.
     """
-    try:
-        mant = line1[53:59].strip()
-        expo = line1[59:61].strip()
-        m = re.match(r"^([ +\-]?)(\d+)$", mant)
-        if not m:
+    if _HAVE_NUMBA and len(line1) >= 61:
+        try:
+            # bytes pass straight into the njit kernel as a uint8 buffer
+            return float(_bstar_kernel(line1.encode("ascii")))
+        except UnicodeEncodeError:
             return float("nan")
-        sign, digits = m.groups()
-        mantissa = float(f"{sign}0.{digits}")
-        exponent = int(expo)
-        return mantissa * (10.0 ** exponent)
-    except Exception:
+    # Pure-Python fallback: direct sign/digit/exponent decode — no regex,
+    # no f-string float round-trip, no exceptions on the malformed path.
+    mant = line1[53:59].strip()
+    sign = 1.0
+    if mant[:1] in ("+", "-"):
+        if mant[0] == "-":
+            sign = -1.0
+        mant = mant[1:]
+    if not (mant.isascii() and mant.isdigit()):
+        return float("nan")
+    mantissa = sign * int(mant) / 10.0 ** len(mant)
+
+    expo = line1[59:61].strip()
+    esign = 1
+    if expo[:1] in ("+", "-"):
+        if expo[0] == "-":
+            esign = -1
+        expo = expo[1:]
+    if not (expo.isascii() and expo.isdigit()):
         return float("nan")
+    return mantissa * 10.0 ** (esign * int(expo))
 
 def _features_from_tle_lines(line1: str, line2: str) -> Tuple[float, float, float, float]:
     """
@@ -139,6 +315,63 @@ def _features_from_tle_lines(line1: str, line2: str) -> Tuple[float, float, floa
     except Exception:
         return float("nan"), float("nan"), float("nan"), float("nan")
 
+def _text_floats(txt: np.ndarray) -> np.ndarray:
+    """float64 conversion of a bytes array, NaN for unparseable entries."""
+    try:
+        return txt.astype(np.float64)
+    except ValueError:
+        out = np.full(len(txt), np.nan)
+        for k, t in enumerate(txt):
+            try:
+                out[k] = float(t)
+            except ValueError:
+                pass
+        return out
+
+
+def _column_floats(buf: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    """
+    Parse a fixed-width column [lo:hi) of an (N, 80) byte matrix to float64.
+    Unparseable or blank fields come back as NaN.
+    """
+    return _text_floats(np.char.strip(buf[:, lo:hi].view(f"S{hi - lo}").ravel()))
+
+
+def _features_from_tle_batch(line1s: list, line2s: list) -> np.ndarray:
+    """
+    Vectorized _features_from_tle_lines over whole TLE line arrays.
+    Stacks the lines into (N, 80) byte matrices and slices the fixed-width
+    fields as NumPy columns — one pass over contiguous memory instead of
+    per-string slicing, f-string assembly, and try/except per satellite.
+    Returns an (N, 4) array of (inc_deg, ecc, mm_rev_day, bstar).
+    """
+    n = len(line1s)
+    b1 = np.array(line1s, dtype="S80").view("S1").reshape(n, 80)
+    b2 = np.array(line2s, dtype="S80").view("S1").reshape(n, 80)
+
+    inc_deg = _column_floats(b2, 8, 16)
+    mm_rev_day = _column_floats(b2, 52, 63)
+
+    # Eccentricity has an implied leading "0."
+    ecc_txt = np.char.strip(b2[:, 26:33].view("S7").ravel())
+    ecc = _text_floats(np.char.add(b"0.", ecc_txt))
+    ecc[ecc_txt == b""] = np.nan
+
+    # BSTAR: implied-decimal mantissa (cols 54-59) and 2-char exponent.
+    mant = np.char.strip(b1[:, 53:59].view("S6").ravel())
+    sign = np.where(np.char.startswith(mant, b"-"), -1.0, 1.0)
+    digits = np.char.lstrip(mant, b"+- ")
+    ok = np.char.isdigit(digits) & (np.char.str_len(digits) > 0)
+    safe_digits = np.where(ok, digits, b"0")
+    mantissa = sign * safe_digits.astype(np.int64) / 10.0 ** np.char.str_len(
+        safe_digits
+    )
+    expo = _column_floats(b1, 59, 61)
+    bstar = np.where(ok, mantissa * 10.0**expo, np.nan)
+
+    return np.column_stack((inc_deg, ecc, mm_rev_day, bstar))
+
+
 def classify_and_color(props: dict) -> Tuple[str, float, Tuple[float, float, float]]:
     """
     Classifies a satellite based on its orbital properties using the loaded ML model.
@@ -149,7 +382,8 @@ def classify_and_color(props: dict) -> Tuple[str, float, Tuple[float, float, flo
     Returns:
         Tuple containing (predicted_label, confidence_probability, color_rgb).
     """
-    if not CLF:
+    clf = _get_model()[0]
+    if not clf:
         return "Unknown", 0.0, TYPE_COLOR["Unknown"]
     try:
         vec = np.array([[float(props["inc_deg"]),
@@ -160,8 +394,14 @@ def classify_and_color(props: dict) -> Tuple[str, float, Tuple[float, float, flo
         return "Unknown", 0.0, TYPE_COLOR["Unknown"]
 
     try:
-        pred = CLF.predict(vec)[0]
-        prob = float(CLF.predict_proba(vec).max()) if hasattr(CLF, "predict_proba") else 1.0
+        # One forward pass: the predicted label is just the argmax of the
+        # probabilities, so a separate predict() call would double the work.
+        if hasattr(clf, "predict_proba"):
+            proba = clf.predict_proba(vec)[0]
+            k = int(proba.argmax())
+            pred, prob = clf.classes_[k], float(proba[k])
+        else:
+            pred, prob = clf.predict(vec)[0], 1.0
     except Exception:
         return "Unknown", 0.0, TYPE_COLOR["Unknown"]
 
@@ -171,25 +411,41 @@ def extract_features_from_sat(sat: Any) -> dict:
     """
     Extracts orbital features from a satellite object.
     Tries direct attributes first, then parses TLE lines if available.
-    
+
     Returns:
         Dictionary with keys: inc_deg, ecc, mm_rev_day, bstar.
     """
-    # 1) Direct attributes on sat (if your loader set them)
+    # 0) TLE text is immutable for the life of the object, so the parsed
+    # features are stashed on the sat and reruns skip the probe cascade.
+    cached = getattr(sat, "_feat_cache", None)
+    if cached is not None:
+        return cached
+
+    feats = _extract_features_uncached(sat)
+    try:
+        sat._feat_cache = feats
+    except AttributeError:
+        pass  # slotted/frozen objects just re-parse next time
+    return feats
+
+
+def _extract_features_uncached(sat: Any) -> dict:
+    # 1) Direct attributes on sat (if your loader set them). Plain type +
+    # finiteness guards: no raised-and-caught ValueError on the hot path.
+    vals = []
     for key in ("inc_deg", "ecc", "mm_rev_day", "bstar"):
-        if hasattr(sat, key):
-            try:
-                _ = float(getattr(sat, key))
-            except Exception:
-                break
+        v = getattr(sat, key, None)
+        if isinstance(v, numbers.Real) and math.isfinite(v):
+            vals.append(float(v))
         else:
+            vals = None
             break
-    else:
+    if vals is not None:
         return {
-            "inc_deg": float(getattr(sat, "inc_deg")),
-            "ecc": float(getattr(sat, "ecc")),
-            "mm_rev_day": float(getattr(sat, "mm_rev_day")),
-            "bstar": float(getattr(sat, "bstar")),
+            "inc_deg": vals[0],
+            "ecc": vals[1],
+            "mm_rev_day": vals[2],
+            "bstar": vals[3],
         }
 
     # 2) Parse from TLE strings if available
@@ -212,24 +468,88 @@ def extract_features_from_sat(sat: Any) -> dict:
 def annotate_satellites_with_ml(satellites: list) -> None:
     """
     Runs ML classification for a list of satellites and attaches results to objects.
-    
+
+    Features are gathered into one (N, 4) matrix so the model is invoked
+    exactly once per batch — sklearn's per-call validation/dispatch overhead
+    is paid once instead of once per satellite.
+
     Attributes added to each satellite:
       - pred_type: Predicted class (Payload, Rocket Body, Debris)
       - pred_conf: Confidence score
       - pred_color: Visualization color
     """
-    counts = {"Payload": 0, "Rocket Body": 0, "Debris": 0, "Unknown": 0}
-    for sat in satellites:
-        feats = extract_features_from_sat(sat)
-        label, prob, color = classify_and_color(feats)
-        setattr(sat, "pred_type", label)
-        setattr(sat, "pred_conf", prob)
-        setattr(sat, "pred_color", color)
-        counts[label] = counts.get(label, 0) + 1
-
+    n = len(satellites)
+    X = np.empty((n, 4), dtype=np.float64)
+
+    # Common case: loaders attach raw TLE lines. Those parse in one
+    # vectorized pass; anything else goes through the scalar extractor.
+    batch_idx, l1s, l2s = [], [], []
+    for i, sat in enumerate(satellites):
+        line1 = getattr(sat, "line1", None)
+        line2 = getattr(sat, "line2", None)
+        if line1 and line2 and not hasattr(sat, "inc_deg"):
+            batch_idx.append(i)
+            l1s.append(line1)
+            l2s.append(line2)
+        else:
+            feats = extract_features_from_sat(sat)
+            X[i, 0] = feats["inc_deg"]
+            X[i, 1] = feats["ecc"]
+            X[i, 2] = feats["mm_rev_day"]
+            X[i, 3] = feats["bstar"]
+    if batch_idx:
+        if len(batch_idx) >= ANNOTATE_PARALLEL_MIN:
+            # Large sets: split the TLE text across cores. Only the line
+            # strings cross the process boundary, so pickling stays cheap;
+            # each worker runs the vectorized byte-matrix parse on its slice.
+            from joblib import Parallel, delayed
+
+            n_jobs = os.cpu_count() or 1
+            bounds = np.linspace(0, len(batch_idx), n_jobs + 1).astype(int)
+            blocks = Parallel(n_jobs=n_jobs)(
+                delayed(_features_from_tle_batch)(l1s[a:b], l2s[a:b])
+                for a, b in zip(bounds[:-1], bounds[1:])
+                if b > a
+            )
+            X[np.asarray(batch_idx)] = np.vstack(blocks)
+        else:
+            X[np.asarray(batch_idx)] = _features_from_tle_batch(l1s, l2s)
+
+    # Rows with NaN features can't be scored; they stay "Unknown".
+    preds = np.full(n, "Unknown", dtype=object)
+    probs = np.zeros(n, dtype=np.float64)
+    finite = np.isfinite(X).all(axis=1)
+    clf, _, _, forest = _get_model()
+    if clf and finite.any():
+        try:
+            if forest is not None and finite.sum() <= FOREST_BATCH_MAX:
+                proba = _forest_predict_proba(forest, X[finite])
+                preds[finite] = clf.classes_[proba.argmax(axis=1)]
+                probs[finite] = proba.max(axis=1)
+            elif hasattr(clf, "predict_proba"):
+                # One forward pass; predict() would just recompute argmax.
+                proba = clf.predict_proba(X[finite])
+                preds[finite] = clf.classes_[proba.argmax(axis=1)]
+                probs[finite] = proba.max(axis=1)
+            else:
+                preds[finite] = clf.predict(X[finite])
+                probs[finite] = 1.0
+        except Exception as e:
+            log.warning("[ML] Batch classification failed (%s).", e)
+
+    idxs = np.fromiter(
+        (CLASS_TO_IDX.get(p, _UNKNOWN_IDX) for p in preds), dtype=np.int32, count=n
+    )
+    for sat, label, prob, ci in zip(satellites, preds, probs, idxs):
+        sat.pred_type = label
+        sat.pred_conf = float(prob)
+        sat.pred_color = _COLOR_TUPLES[ci]
+
+    labels, counts = np.unique(preds.astype(str), return_counts=True)
+    summary = dict(zip(labels, counts))
     log.info("ML classification summary: Payload=%d, Rocket Body=%d, Debris=%d, Unknown=%d",
-             counts.get("Payload", 0), counts.get("Rocket Body", 0),
-             counts.get("Debris", 0), counts.get("Unknown", 0))
+             summary.get("Payload", 0), summary.get("Rocket Body", 0),
+             summary.get("Debris", 0), summary.get("Unknown", 0))
 
 def _safe(func, *args, **kwargs):
     """Run a step and log any exception without crashing the whole run."""
@@ -280,9 +600,17 @@ def main():
     else:
         log.warning("orbit_predictor.load_tles() unavailable.")
 
-    # Dedupe by name
-    sat_by_name = {getattr(s, "name", f"SAT-{i}"): s for i, s in enumerate(satellites)}
-    satellites = list(sat_by_name.values())
+    # Dedupe by name in one pass with a seen-set — no intermediate dict of
+    # every satellite. First occurrence wins, so the famous sats loaded
+    # above keep priority over their duplicates in the general file.
+    seen = set()
+    deduped = []
+    for i, s in enumerate(satellites):
+        name = getattr(s, "name", f"SAT-{i}")
+        if name not in seen:
+            seen.add(name)
+            deduped.append(s)
+    satellites = deduped
 
     if not satellites:
         log.error("No satellites loaded. Exiting early. Check TLE fetch/paths.")
@@ -295,7 +623,7 @@ def main():
     # ------------------------------------------
     # Step 2.5: Classify & annotate with ML
     # ------------------------------------------
-    if CLF:
+    if _get_model()[0]:
         annotate_satellites_with_ml(satellites)
     else:
         log.info("[ML] Model not available; skipping classification.")
@@ -304,10 +632,18 @@ def main():
     # Step 3: Collision prediction (cap set size)
     # ------------------------------------------
     log.info("[3/4] Checking for close approaches...")
+    try:
+        from backend import collision_checker
+    except Exception as e:
+        log.exception("Import error: backend.collision_checker failed: %s", e)
+        collision_checker = None
     if collision_checker and hasattr(collision_checker, "check_collisions"):
         if len(satellites) >= 2:
-            subset = satellites[:COLLISION_MAX]
-            if len(satellites) > COLLISION_MAX:
+            # No slicing cap by default: the checker's broad phase (radial
+            # shells / per-timestep KD-tree) prunes far-apart orbits, so the
+            # full set scales. SDT_COLLISION_MAX>0 restores the old cap.
+            subset = satellites[:COLLISION_MAX] if COLLISION_MAX > 0 else satellites
+            if 0 < COLLISION_MAX < len(satellites):
                 log.info("[i] Using first %d satellites for collision check (cap).", COLLISION_MAX)
             _safe(collision_checker.check_collisions, subset, threshold_km=10)
             log.info("✔ Collision analysis complete.")
@@ -320,6 +656,17 @@ def main():
     # Step 4: Visualization (2D live + 3D)
     # ------------------------------------------
     log.info("[4/4] Visualization...")
+    visualizer = orbit_plotter = None
+    if ENABLE_2D:
+        try:
+            from backend import visualizer
+        except Exception as e:
+            log.exception("Import error: backend.visualizer failed: %s", e)
+    if ENABLE_3D:
+        try:
+            from backend import orbit_plotter
+        except Exception as e:
+            log.exception("Import error: backend.orbit_plotter failed: %s", e)
     if ENABLE_2D and visualizer and hasattr(visualizer, "plot_animated_positions_live"):
         log.info("Opening 2D live animation window (max_sats=%d). Close the window to continue.", LIVE2D_MAX)
         _safe(visualizer.plot_animated_positions_live, satellites, interval_ms=200, max_sats=LIVE2D_MAX)
@@ -7,13 +7,23 @@ Lightweight cached client for NASA DONKI & NEO APIs.
 """
 
 from __future__ import annotations
+import gzip
 import json
+import os
+import time
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 import requests
 
+# orjson is optional: C-level encode/decode, several times faster than
+# stdlib json. Falls back silently if not installed.
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 # Import config (already set up in earlier steps)
 try:
     from backend.config import NASA_API_KEY, DONKI_BASE, NEO_BASE
@@ -29,37 +39,118 @@ NEO_DIR = CACHE_ROOT / "neo"
 DONKI_FRESH_MIN = 60  # minutes
 NEO_FRESH_MIN = 60  # minutes
 
+# Pooled session shared by both fetchers: keep-alive across the DONKI
+# and NEO calls, with retries on transient NASA-side errors.
+_SESSION: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        from requests.adapters import HTTPAdapter, Retry
+
+        s = requests.Session()
+        s.mount(
+            "https://",
+            HTTPAdapter(
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            ),
+        )
+        _SESSION = s
+    return _SESSION
+
 
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
 def _is_fresh(file: Path, minutes: int) -> bool:
-    if not file.exists():
+    # Integer-nanosecond comparison: one stat, one subtraction, no
+    # datetime/timedelta objects per check.
+    try:
+        mtime_ns = file.stat().st_mtime_ns
+    except FileNotFoundError:
         return False
-    age = datetime.now() - datetime.fromtimestamp(file.stat().st_mtime)
-    return age <= timedelta(minutes=minutes)
+    return time.time_ns() - mtime_ns <= minutes * 60_000_000_000
 
 
 def _latest_json_in(dirpath: Path) -> Optional[Path]:
+    # Timestamped names sort chronologically regardless of .json/.json.gz,
+    # so caches written before the gzip switch are still picked up.
     if not dirpath.exists():
         return None
-    files = sorted([p for p in dirpath.glob("*.json") if p.is_file()])
+    files = sorted(
+        p
+        for p in dirpath.glob("*.json*")
+        if p.is_file() and not p.name.endswith(".headers.json")
+    )
     return files[-1] if files else None
 
 
-def _save_json(dirpath: Path, payload: Any) -> Path:
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _headers_sidecar(path: Path) -> Path:
+    """Sidecar path holding the validators for a cached payload."""
+    stem = path.name.split(".")[0]
+    return path.with_name(f"{stem}.headers.json")
+
+
+def _save_json(dirpath: Path, payload: Any, response_headers: Any = None) -> Path:
     _ensure_dir(dirpath)
     ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    out = dirpath / f"{ts}.json"
-    with out.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    out = dirpath / f"{ts}.json.gz"
+    with gzip.open(out, "wb", compresslevel=6) as f:
+        f.write(_dumps(payload))
+    if response_headers is not None:
+        validators = {
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+        }
+        if any(validators.values()):
+            _headers_sidecar(out).write_bytes(_dumps(validators))
     return out
 
 
+def _conditional_headers(latest: Optional[Path]) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since built from the latest sidecar."""
+    headers: Dict[str, str] = {}
+    if latest is None:
+        return headers
+    side = _headers_sidecar(latest)
+    if not side.exists():
+        return headers
+    try:
+        validators = _loads(side.read_bytes())
+    except Exception:
+        return headers
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
 def _read_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            return _loads(f.read())
+    with path.open("rb") as f:
+        return _loads(f.read())
 
 
 def fetch_donki_notifications(use_cache: bool = True) -> Dict[str, Any]:
@@ -73,10 +164,19 @@ def fetch_donki_notifications(use_cache: bool = True) -> Dict[str, Any]:
         return {"source": "cache", "path": str(latest), "data": _read_json(latest)}
 
     url = f"{DONKI_BASE}/notifications"
-    r = requests.get(url, params={"api_key": NASA_API_KEY}, timeout=30)
+    r = _get_session().get(
+        url,
+        params={"api_key": NASA_API_KEY},
+        headers=_conditional_headers(latest) or None,
+        timeout=30,
+    )
+    if r.status_code == 304 and latest:
+        # Upstream unchanged: refresh the freshness clock, reuse the payload.
+        os.utime(latest, None)
+        return {"source": "cache-304", "path": str(latest), "data": _read_json(latest)}
     r.raise_for_status()
     data = r.json()
-    saved = _save_json(DONKI_DIR, data)
+    saved = _save_json(DONKI_DIR, data, response_headers=r.headers)
     return {"source": "network", "path": str(saved), "data": data}
 
 
@@ -91,10 +191,16 @@ def fetch_neo_today(use_cache: bool = True) -> Dict[str, Any]:
         return {"source": "cache", "path": str(latest), "data": _read_json(latest)}
 
     url = f"{NEO_BASE}/feed/today"
-    r = requests.get(
-        url, params={"detailed": "false", "api_key": NASA_API_KEY}, timeout=30
+    r = _get_session().get(
+        url,
+        params={"detailed": "false", "api_key": NASA_API_KEY},
+        headers=_conditional_headers(latest) or None,
+        timeout=30,
     )
+    if r.status_code == 304 and latest:
+        os.utime(latest, None)
+        return {"source": "cache-304", "path": str(latest), "data": _read_json(latest)}
     r.raise_for_status()
     data = r.json()
-    saved = _save_json(NEO_DIR, data)
+    saved = _save_json(NEO_DIR, data, response_headers=r.headers)
     return {"source": "network", "path": str(saved), "data": data}
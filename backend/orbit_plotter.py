@@ -1,38 +1,109 @@
+from __future__ import annotations
+
+import functools
 import os
-from typing import Any, List
+import sys
+from typing import TYPE_CHECKING, Any, List
 import numpy as np
-import pyvista as pv
-from skyfield.api import load
+
+# pyvista drags in VTK's shared libraries and skyfield loads ephemeris
+# machinery; both cost hundreds of ms at import time. Deferred into the
+# functions that need them so importing this module stays cheap for
+# callers that never open the 3D view. After the first call they are
+# sys.modules hits.
+if TYPE_CHECKING:
+    import pyvista as pv
 
 # Assets Configuration
 EARTH_RADIUS_KM = 6371.0
+# Altitude bin edges (km) separating LEO / MEO / GEO-and-above.
+ORBIT_TIER_EDGES_KM = np.array([2000.0, 35786.0])
+ORBIT_TIER_NAMES = ("LEO", "MEO", "GEO+")
 TEXTURES_DIR = os.path.join("assets", "textures")
 EARTH_DAY_TEX = os.path.join(TEXTURES_DIR, "earth_day.jpg")
+# Thread the trail propagation across satellites once the scene is big
+# enough to amortize pool startup; each satellite's SGP4 run is
+# independent. Workers default to the core count (SDT_TRAIL_WORKERS=1
+# forces serial).
+TRAIL_PARALLEL_MIN = int(os.environ.get("SDT_TRAIL_PARALLEL_MIN", 512))
+
+
+def _f32(a) -> np.ndarray:
+    """C-contiguous float32 copy for coordinate arrays handed to VTK."""
+    return np.ascontiguousarray(a, dtype=np.float32)
+
+
+# Lazily built timescale singleton: load.timescale() re-parses delta-T
+# tables on every call, which is wasteful for repeated plots.
+_TS = None
+
+
+def _get_ts():
+    global _TS
+    if _TS is None:
+        from skyfield.api import load
+
+        _TS = load.timescale()
+    return _TS
 
 
 # ---------------------------
 # Helper: Earth & Rings
 # ---------------------------
-def _add_textured_earth(plotter: pv.Plotter):
-    sphere = pv.Sphere(radius=EARTH_RADIUS_KM, theta_resolution=180, phi_resolution=180)
+@functools.lru_cache(maxsize=8)
+def _read_texture_cached(path: str, mtime: float):
+    """Decode a texture once per (path, mtime); repeat plots reuse it."""
+    import pyvista as pv
+
+    return pv.read_texture(path)
+
+
+@functools.lru_cache(maxsize=1)
+def _earth_sphere_template():
+    """
+    UV-mapped Earth sphere, built once per process. 90x90 tessellation is
+    visually indistinguishable from the old 180x180 at typical window
+    sizes for a background globe, at a quarter of the triangle count.
+    """
+    import pyvista as pv
+
+    sphere = pv.Sphere(radius=EARTH_RADIUS_KM, theta_resolution=90, phi_resolution=90)
     sphere.texture_map_to_sphere(inplace=True)
+    return sphere
+
+
+def _add_textured_earth(plotter: pv.Plotter):
+    sphere = _earth_sphere_template().copy()
     try:
         if os.path.exists(EARTH_DAY_TEX):
-            tex = pv.read_texture(EARTH_DAY_TEX)
-            plotter.add_mesh(sphere, texture=tex, name="Earth")
+            tex = _read_texture_cached(EARTH_DAY_TEX, os.path.getmtime(EARTH_DAY_TEX))
+            actor = plotter.add_mesh(sphere, texture=tex, name="Earth")
         else:
-            plotter.add_mesh(sphere, color="blue", opacity=0.9, name="Earth")
+            actor = plotter.add_mesh(sphere, color="blue", opacity=0.9, name="Earth")
     except Exception:
-        plotter.add_mesh(sphere, color="blue", name="Earth")
+        actor = plotter.add_mesh(sphere, color="blue", name="Earth")
+    return actor
+
+
+@functools.lru_cache(maxsize=1)
+def _unit_sphere_template():
+    """
+    Unit sphere tessellated once; rings are scaled copies of it. 30x30
+    is plenty for shells drawn at 0.1 opacity — their silhouette is the
+    only thing the eye can resolve.
+    """
+    import pyvista as pv
+
+    return pv.Sphere(radius=1.0, theta_resolution=30, phi_resolution=30)
 
 
 def _add_orbit_rings(plotter: pv.Plotter):
     rings = [(2000, "green", "LEO"), (35786, "blue", "GEO")]
     actors = []
     for alt, col, label in rings:
-        mesh = pv.Sphere(
-            radius=EARTH_RADIUS_KM + alt, theta_resolution=60, phi_resolution=60
-        )
+        # Only the radius differs between rings (and between calls), so
+        # scale the shared template instead of re-tessellating a sphere.
+        mesh = _unit_sphere_template().scale(EARTH_RADIUS_KM + alt)
         actor = plotter.add_mesh(mesh, color=col, opacity=0.1, name=label)
         actors.append(actor)
     return actors
@@ -41,34 +112,109 @@ def _add_orbit_rings(plotter: pv.Plotter):
 # ---------------------------
 # Main 3D Plotter with UI
 # ---------------------------
-def plot_satellite_orbits_3d(
+class OrbitScene:
+    """
+    Persistent 3D scene for repeated renders. Earth, rings, trails,
+    labels, and widgets are built exactly once; update() rewrites only
+    the marker point coordinates in place, so animating satellite motion
+    costs one position write and one render per frame — no actor
+    rebuilds, no re-tessellation, no new OpenGL context.
+    """
+
+    def __init__(self, plotter, category_actors, clouds, cloud_rows, sats):
+        self.plotter = plotter
+        self.category_actors = category_actors
+        self._clouds = clouds          # stype -> marker PolyData
+        self._cloud_rows = cloud_rows  # per sat: (stype, row in its cloud)
+        self._sats = sats
+
+    def update(self, t=None) -> None:
+        """Move the satellite markers to time t (default: now) and render."""
+        if not self._sats:
+            return
+        if t is None:
+            t = _get_ts().now()
+        new_points = {s: c.points.copy() for s, c in self._clouds.items()}
+        for sat, (stype, row) in zip(self._sats, self._cloud_rows):
+            try:
+                # Raw TEME state — same frame the trails were built in.
+                pos, _vel, _msg = sat._position_and_velocity_TEME_km(t)
+            except Exception:
+                continue
+            if np.isfinite(pos).all():
+                new_points[stype][row] = pos
+        for stype, cloud in self._clouds.items():
+            cloud.points = new_points[stype]  # VBO update on the same actor
+        self.plotter.render()
+
+    def screenshot(self, path: str) -> None:
+        """
+        Save the current frame to `path`. Reads back the persistent
+        plotter's framebuffer (`plotter.image`) after a render instead of
+        going through plotter.screenshot(), which allocates a fresh render
+        texture per call — the FBO is reused across repeated saves, so
+        exporting an animation costs one readback per frame.
+        """
+        if not getattr(self.plotter, "_rendered", False):
+            # First frame: pyvista only exposes .image after the window
+            # has been shown once; do it non-blocking and keep it open.
+            self.plotter.show(auto_close=False, interactive=False)
+        self.plotter.render()
+        img = self.plotter.image
+        try:
+            import imageio.v3 as iio
+
+            iio.imwrite(path, img)
+        except ImportError:
+            from PIL import Image
+
+            Image.fromarray(img).save(path)
+
+    def show(self) -> None:
+        self.plotter.show()
+
+
+def build_orbit_scene(
     satellites: List[Any],
     minutes: int = 30,
     step_seconds: int = 60,
     max_satellites: int = 200,
 ):
+    """Build the full scene once and return it as a reusable OrbitScene."""
+    import pyvista as pv
+
     if not satellites:
         print("No satellites to plot.")
-        return
+        return None
 
     # Limit satellites for performance
     satellites = satellites[:max_satellites]
 
-    # Setup Time
-    ts = load.timescale()
+    # Setup Time: one vectorized Time array — each sat.at(times) call then
+    # propagates the whole trail in a single pass instead of paying
+    # Skyfield's per-step Time machinery once per trail point.
+    ts = _get_ts()
     t0 = ts.now()
-    times = [
-        t0 + (i * step_seconds / 86400.0)
-        for i in range(int((minutes * 60) / step_seconds))
-    ]
+    n_steps = int((minutes * 60) / step_seconds)
+    times = ts.tt_jd(t0.tt + np.arange(n_steps) * step_seconds / 86400.0)
 
-    # Setup Plotter
+    # Setup Plotter. Headless environments (CI, SSH sessions without X)
+    # can't open the interactive window; render off-screen there instead
+    # of blocking on a GPU context that will never appear.
+    off_screen = bool(os.environ.get("PYVISTA_OFF_SCREEN")) or (
+        sys.platform.startswith("linux") and not os.environ.get("DISPLAY")
+    )
     plotter = pv.Plotter(
-        window_size=[1200, 800], title="ORCAS - Advanced View"
+        window_size=[1200, 800], title="ORCAS - Advanced View", off_screen=off_screen
     )
     plotter.set_background("black")  # type: ignore
-    _add_textured_earth(plotter)
-    _add_orbit_rings(plotter)
+    # Earth and the tier rings are backdrop: excluding them from the
+    # picker means a click only ray-tests the small satellite clouds
+    # instead of the many-thousand-cell spheres.
+    earth_actor = _add_textured_earth(plotter)
+    earth_actor.SetPickable(False)
+    for ring_actor in _add_orbit_rings(plotter):
+        ring_actor.SetPickable(False)
 
     # Actor Categories for UI Toggling
     category_actors = {
@@ -81,52 +227,204 @@ def plot_satellite_orbits_3d(
 
     print(f"[Visualizer] Computing orbits for {len(satellites)} objects...")
 
-    for sat in satellites:
-        # Calculate Orbit Trail
+    # The trail pass leans on python-sgp4's C extension; without it the
+    # pure-Python propagator is ~50x slower, which is worth a heads-up
+    # rather than a silently sluggish plot.
+    try:
+        from sgp4.api import accelerated as _sgp4_accelerated
+    except Exception:
+        _sgp4_accelerated = True
+    if not _sgp4_accelerated:
+        print(
+            "[Visualizer] Warning: sgp4 C extension unavailable; "
+            "falling back to the slow pure-Python propagator."
+        )
+
+    color_map = {
+        "Payload": "lime",
+        "Rocket Body": "yellow",
+        "Debris": "red",
+        "Unknown": "grey",
+    }
+
+    # Geometry is accumulated per category and merged into ONE trail
+    # actor and ONE marker actor per category below: VTK render cost
+    # scales with actor count, so 3 actors per satellite becomes ~2 per
+    # category regardless of satellite count.
+    cat_trails = {c: [] for c in color_map}
+    cat_centers = {c: [] for c in color_map}
+    plotted_sats = []       # sats that actually made it into the scene,
+    plotted_positions = []  # aligned with their current positions
+    plotted_speeds = []     # ... and their current speeds (km/s)
+    cloud_rows = []         # per sat: (category, row in that marker cloud)
+
+    # One vectorized call per satellite. The scene only needs a
+    # self-consistent Cartesian frame, so take the raw TEME output
+    # straight from SGP4 and skip the TEME->GCRS nutation/precession
+    # rotation entirely — it was the single largest cost of the old
+    # sat.at(...).position path.
+    def _propagate(sat):
         try:
-            positions = [sat.at(t).position.km for t in times]
-            if len(positions) < 2:
-                continue
-            points = np.array(positions)
+            r, v, _msgs = sat._position_and_velocity_TEME_km(times)
+            return r, v
         except Exception:
+            return None
+
+    n_workers = int(os.environ.get("SDT_TRAIL_WORKERS", 0)) or (os.cpu_count() or 1)
+    if len(satellites) >= TRAIL_PARALLEL_MIN and n_workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            states = list(ex.map(_propagate, satellites, chunksize=64))
+    else:
+        states = map(_propagate, satellites)
+
+    for sat, state in zip(satellites, states):
+        if state is None:
+            continue
+        teme_r, teme_v = state
+        # .T of the (3, N) output is F-ordered float64; VTK wants
+        # C-contiguous float32 for upload anyway, so cast once here.
+        points = _f32(teme_r.T)  # (n_steps, 3)
+        # Failed propagation steps come back as NaN instead of raising
+        # in vectorized mode; skip those sats like the old per-step path.
+        if len(points) < 2 or not np.isfinite(points).all():
             continue
 
         # Determine Type & Color
         # Uses your ML tags if they exist, otherwise defaults
         stype = getattr(sat, "pred_type", "Unknown")
-        if stype not in category_actors:
+        if stype not in cat_trails:
             stype = "Unknown"
+        color = color_map[stype]
 
-        color_map = {
-            "Payload": "lime",
-            "Rocket Body": "yellow",
-            "Debris": "red",
-            "Unknown": "grey",
-        }
-        color = color_map.get(stype, "white")
+        # Keep the raw sample array; all of a category's trails are
+        # concatenated into one PolyData below rather than building a
+        # mesh per satellite here.
+        cat_trails[stype].append(points)
 
-        # Add Orbit Line
-        line = pv.Spline(points, 100)
-        actor_trail = plotter.add_mesh(line, color=color, opacity=0.6)
-        category_actors[stype].append(actor_trail)
-
-        # Add Satellite Point (Sphere)
         pos_now = points[0]
-        sphere = pv.Sphere(radius=80, center=pos_now)
-        actor_sat = plotter.add_mesh(sphere, color=color)
-        category_actors[stype].append(actor_sat)
-
-        # Add Label
-        label_text = f"{sat.name}"
-        # point_labels returns a VTK actor we need to track
-        actor_label = plotter.add_point_labels(
-            np.array([pos_now]),
-            [label_text],
+        cloud_rows.append((stype, len(cat_centers[stype])))
+        cat_centers[stype].append(pos_now)
+        plotted_sats.append(sat)
+        plotted_positions.append(pos_now)
+        # SGP4 hands back the analytic velocity with the state above, so
+        # the speed shown on pick is a free by-product of the trail pass.
+        plotted_speeds.append(float(np.linalg.norm(teme_v[:, 0])))
+
+    # Materialize the position list once; the labels, the tier census,
+    # and the pick tree below all read from this single array instead of
+    # each converting the Python list again.
+    pos_arr = _f32(plotted_positions) if plotted_positions else None
+
+    # One batched label actor for the whole scene: VTK's label hierarchy
+    # takes the (N, 3) points + N strings natively, so N per-satellite
+    # label actors collapse into one.
+    if plotted_sats:
+        actor_labels = plotter.add_point_labels(
+            pos_arr,
+            [sat.name for sat in plotted_sats],
             font_size=10,
-            text_color=color,
+            text_color="white",
             always_visible=False,
         )
-        category_actors["Labels"].append(actor_label)
+        category_actors["Labels"].append(actor_labels)
+
+    # Orbit-tier census in one vectorized pass: a single digitize over
+    # every plotted position instead of a Python branch per satellite.
+    # The altitudes double as the per-satellite cache the pick handler
+    # reads from.
+    alts = None
+    if pos_arr is not None:
+        alts = np.linalg.norm(pos_arr, axis=1) - EARTH_RADIUS_KM
+        tiers = np.bincount(
+            np.digitize(alts, ORBIT_TIER_EDGES_KM), minlength=len(ORBIT_TIER_NAMES)
+        )
+        summary = ", ".join(f"{n}: {c}" for n, c in zip(ORBIT_TIER_NAMES, tiers))
+        print(f"[Visualizer] Orbit tiers — {summary}")
+
+    # One merged mesh per category keeps the checkbox toggles working:
+    # each category still maps to its own (now merged) actors. The merge
+    # is a plain vstack plus one polyline connectivity array — one VBO
+    # and one draw call per category, with none of the cell-appending
+    # work a MultiBlock combine() would do.
+    def _merged_polylines(arrays):
+        counts = np.fromiter((len(a) for a in arrays), dtype=np.int64)
+        pts = np.vstack(arrays)
+        # Cell stream per trail: [n_points, idx0, ..., idx_{n-1}]
+        ids = np.arange(len(pts), dtype=np.int64)
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        lines = np.concatenate(
+            [np.concatenate(([c], ids[b:e])) for c, b, e in zip(counts, bounds, bounds[1:])]
+        )
+        merged = pv.PolyData()
+        merged.points = pts
+        merged.lines = lines
+        return merged
+
+    clouds = {}
+    for stype, color in color_map.items():
+        if cat_trails[stype]:
+            merged_trails = _merged_polylines(cat_trails[stype])
+            actor_trail = plotter.add_mesh(merged_trails, color=color, opacity=0.6)
+            actor_trail.SetPickable(False)  # inspect markers, not trails
+            category_actors[stype].append(actor_trail)
+        if cat_centers[stype]:
+            # Point sprites: one vertex per satellite drawn as a round
+            # sprite, instead of a tessellated ~400-triangle sphere each.
+            cloud = pv.PolyData(_f32(cat_centers[stype]))
+            clouds[stype] = cloud
+            actor_sat = plotter.add_mesh(
+                cloud,
+                color=color,
+                render_points_as_spheres=True,
+                point_size=14,
+            )
+            category_actors[stype].append(actor_sat)
+
+    # Click-to-inspect: nearest satellite resolved by a KD-Tree over the
+    # positions computed above — O(log N) per pick, no extra propagation.
+    if pos_arr is not None:
+        from scipy.spatial import cKDTree
+
+        pick_positions = pos_arr
+        pick_tree = cKDTree(pick_positions)
+
+        def on_pick(picked_point):
+            # The bound lets cKDTree prune subtrees beyond 300 km during
+            # the walk; misses come back as idx == n with dist == inf.
+            dist, idx = pick_tree.query(picked_point, distance_upper_bound=300.0)
+            if idx == pick_tree.n:  # click on empty space
+                return
+            sat = plotted_sats[idx]
+            stype = getattr(sat, "pred_type", "Unknown")
+            # Altitude and speed were both cached during the trail pass:
+            # a pick is pure array lookups, no recomputation at click
+            # time.
+            print(
+                f"[Visualizer] Picked: {sat.name} ({stype}) "
+                f"| Alt: {alts[idx]:.0f} km | Vel: {plotted_speeds[idx]:.2f} km/s"
+            )
+
+        try:
+            # Explicit vtkPointPicker: screen-space hit on the pickable
+            # point clouds, never a cell-intersection walk over meshes.
+            plotter.enable_point_picking(
+                callback=on_pick,
+                show_message="Pick a point near a satellite to inspect it",
+                picker="point",
+            )
+        except TypeError:
+            # Older pyvista without the picker kwarg.
+            try:
+                plotter.enable_point_picking(
+                    callback=on_pick,
+                    show_message="Pick a point near a satellite to inspect it",
+                )
+            except Exception:
+                pass
+        except Exception:
+            pass  # picking is a convenience; never block the plot
 
     # ---------------------------------------------------------
     # UI WIDGETS (Interactive Controls)
@@ -176,4 +474,20 @@ def plot_satellite_orbits_3d(
     plotter.add_text("Show Labels", position=(50, start_y + 85), font_size=12)
 
     plotter.add_axes()  # type: ignore
-    plotter.show()
+    return OrbitScene(plotter, category_actors, clouds, cloud_rows, plotted_sats)
+
+
+def plot_satellite_orbits_3d(
+    satellites: List[Any],
+    minutes: int = 30,
+    step_seconds: int = 60,
+    max_satellites: int = 200,
+):
+    scene = build_orbit_scene(
+        satellites,
+        minutes=minutes,
+        step_seconds=step_seconds,
+        max_satellites=max_satellites,
+    )
+    if scene is not None:
+        scene.show()
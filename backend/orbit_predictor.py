@@ -3,7 +3,14 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+import pickle
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import requests
 from skyfield.api import EarthSatellite, load, wgs84
 
@@ -21,6 +28,30 @@ FAMOUS_SAT_NAMES = [
 
 CELESTRAK_GP_BASE = "https://celestrak.org/NORAD/elements/gp.php"
 
+# Shared session: keep-alive means the per-name CelesTrak fetches reuse
+# one TLS connection instead of handshaking for every satellite.
+_SESSION = None
+
+
+def _get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+    return _SESSION
+
+
+# Lazily built timescale singleton: load.timescale() re-parses the
+# leap-second and delta-T tables on every call, and the loaders below
+# were each paying that per invocation.
+_TS = None
+
+
+def _get_ts():
+    global _TS
+    if _TS is None:
+        _TS = load.timescale()
+    return _TS
+
 
 def _attach_tle_metadata(sat: EarthSatellite, line1: str, line2: str) -> EarthSatellite:
     """Attach raw TLE lines so the ML code in main.py can parse features."""
@@ -29,14 +60,25 @@ def _attach_tle_metadata(sat: EarthSatellite, line1: str, line2: str) -> EarthSa
     return sat
 
 
+# Successful by-name lookups, memoized per process (TLEs don't change
+# on that timescale). Failures are deliberately NOT stored, so a
+# transient network error or CelesTrak hiccup can be retried on the
+# next call instead of poisoning the name for the process lifetime.
+_TLE_BY_NAME_CACHE: dict[str, tuple[str, str]] = {}
+
+
 def _fetch_tle_by_name(name: str, timeout: int = 30) -> tuple[str, str] | None:
     """
     Fetch a specific satellite's TLE by NAME using CelesTrak gp.php.
     Returns (line1, line2) or None if not found/invalid.
     """
+    cached = _TLE_BY_NAME_CACHE.get(name)
+    if cached is not None:
+        return cached
+
     url = f"{CELESTRAK_GP_BASE}?NAME={urllib.parse.quote(name)}&FORMAT=tle"
     try:
-        r = requests.get(url, timeout=timeout)
+        r = _get_session().get(url, timeout=timeout)
         r.raise_for_status()
         lines = [ln.strip() for ln in r.text.splitlines() if ln.strip()]
         # Expect sequences of 3 lines: NAME, L1, L2 (there can be multiple entries)
@@ -46,7 +88,9 @@ def _fetch_tle_by_name(name: str, timeout: int = 30) -> tuple[str, str] | None:
                 and lines[i + 1].startswith("1 ")
                 and lines[i + 2].startswith("2 ")
             ):
-                return lines[i + 1], lines[i + 2]
+                pair = (lines[i + 1], lines[i + 2])
+                _TLE_BY_NAME_CACHE[name] = pair
+                return pair
         return None
     except Exception:
         return None
@@ -55,35 +99,54 @@ def _fetch_tle_by_name(name: str, timeout: int = 30) -> tuple[str, str] | None:
 # --------------------------------------------------------------------
 # Load general satellite TLEs from local file
 # --------------------------------------------------------------------
-def load_tles(file_path: str = "data/latest_tle.txt") -> list[EarthSatellite]:
-    """
-    Load satellites from a local TLE file.
+# Parsed (name, line1, line2) triples are cached on disk keyed by the
+# source file's mtime, so warm launches skip re-reading and re-walking
+# the TLE text entirely.
+_PARSE_CACHE_DIR = Path("data") / "cache" / "tle_parse"
 
-    Supports mixed formats in the same file:
-      - 3-line format: (Name, Line1, Line2)
-      - 2-line format: (Line1, Line2) -> Name defaults to "UNKNOWN"
 
-    Args:
-        file_path: Path to the TLE file.
+def _parse_cache_path(file_path: str) -> Path:
+    digest = hashlib.md5(str(file_path).encode("utf-8")).hexdigest()[:12]
+    return _PARSE_CACHE_DIR / f"{Path(file_path).stem}_{digest}.pkl"
 
-    Returns:
-        List of Skyfield EarthSatellite objects.
-    """
-    satellites = []
-    ts = load.timescale()
 
+def _read_parse_cache(file_path: str, mtime_ns: int):
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            # Filter out empty lines immediately
-            lines = [line.strip() for line in file if line.strip()]
+        with open(_parse_cache_path(file_path), "rb") as f:
+            cached_mtime, triples = pickle.load(f)
+        return triples if cached_mtime == mtime_ns else None
+    except Exception:
+        return None
 
-    except FileNotFoundError:
-        print(f"TLE file '{file_path}' not found.")
-        return []
 
+def _write_parse_cache(file_path: str, mtime_ns: int, triples) -> None:
+    try:
+        _PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_parse_cache_path(file_path), "wb") as f:
+            pickle.dump((mtime_ns, triples), f)
+    except Exception:
+        pass  # cache is best-effort; parsing already succeeded
+
+
+def _parse_tle_lines(lines: list[str]) -> list[tuple[str, str, str]]:
+    """Split stripped TLE text lines into (name, line1, line2) triples."""
+    triples = []
     i = 0
     n = len(lines)
 
+    # Fast path: the normal CelesTrak layout is uniform 3-line blocks
+    # (Name, Line1, Line2). Verify that shape with three strided scans
+    # and slice the whole file at once — the per-line state machine
+    # below is only needed for mixed or partially malformed files.
+    if n >= 3 and n % 3 == 0:
+        names, l1s, l2s = lines[0::3], lines[1::3], lines[2::3]
+        if (
+            all(a.startswith("1 ") for a in l1s)
+            and all(b.startswith("2 ") for b in l2s)
+            and not any(nm.startswith(("1 ", "2 ")) for nm in names)
+        ):
+            return list(zip(names, l1s, l2s))
+
     while i < n:
         # Check for 3-line format: Name, Line1, Line2
         # We need at least 3 lines remaining, and the structure must match
@@ -92,33 +155,73 @@ def load_tles(file_path: str = "data/latest_tle.txt") -> list[EarthSatellite]:
             and lines[i + 1].startswith("1 ")
             and lines[i + 2].startswith("2 ")
         ):
-            name = lines[i]
-            line1 = lines[i + 1]
-            line2 = lines[i + 2]
-            try:
-                sat = EarthSatellite(line1, line2, name, ts)
-                satellites.append(_attach_tle_metadata(sat, line1, line2))
-            except Exception:
-                pass  # Skip malformed TLEs
+            triples.append((lines[i], lines[i + 1], lines[i + 2]))
             i += 3
 
         # Check for 2-line format: Line1, Line2
         # We need at least 2 lines remaining
         elif i + 1 < n and lines[i].startswith("1 ") and lines[i + 1].startswith("2 "):
-            name = "UNKNOWN"
-            line1 = lines[i]
-            line2 = lines[i + 1]
-            try:
-                sat = EarthSatellite(line1, line2, name, ts)
-                satellites.append(_attach_tle_metadata(sat, line1, line2))
-            except Exception:
-                pass
+            triples.append(("UNKNOWN", lines[i], lines[i + 1]))
             i += 2
 
         else:
             # Current line doesn't start a valid TLE block, skip it
             i += 1
 
+    return triples
+
+
+@functools.lru_cache(maxsize=4)
+def _load_tles_cached(file_path: str, mtime_ns: int) -> tuple[EarthSatellite, ...]:
+    """
+    Build EarthSatellite objects for a TLE file, memoized per process.
+
+    Keyed on (path, mtime_ns): calling load_tles twice in one run — the
+    CLI does this when switching views — skips even the disk cache and
+    the SGP4 initialization of tens of thousands of satellites.
+    """
+    ts = _get_ts()
+
+    triples = _read_parse_cache(file_path, mtime_ns)
+    if triples is None:
+        with open(file_path, "r", encoding="utf-8") as file:
+            # Filter out empty lines immediately
+            lines = [line.strip() for line in file if line.strip()]
+        triples = _parse_tle_lines(lines)
+        _write_parse_cache(file_path, mtime_ns, triples)
+
+    satellites = []
+    for name, line1, line2 in triples:
+        try:
+            sat = EarthSatellite(line1, line2, name, ts)
+            satellites.append(_attach_tle_metadata(sat, line1, line2))
+        except Exception:
+            pass  # Skip malformed TLEs
+
+    return tuple(satellites)
+
+
+def load_tles(file_path: str = "data/latest_tle.txt") -> list[EarthSatellite]:
+    """
+    Load satellites from a local TLE file.
+
+    Supports mixed formats in the same file:
+      - 3-line format: (Name, Line1, Line2)
+      - 2-line format: (Line1, Line2) -> Name defaults to "UNKNOWN"
+
+    Args:
+        file_path: Path to the TLE file.
+
+    Returns:
+        List of Skyfield EarthSatellite objects.
+    """
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except FileNotFoundError:
+        print(f"TLE file '{file_path}' not found.")
+        return []
+
+    satellites = list(_load_tles_cached(file_path, mtime_ns))
     print(f"Loaded {len(satellites)} satellites from TLE file.")
     return satellites
 
@@ -134,13 +237,16 @@ def load_famous_sats(
     Try to load a curated set of famous satellites by NAME from CelesTrak (online).
     If none could be loaded, fall back to local file.
     """
-    ts = load.timescale()
+    ts = _get_ts()
     sats = []
     names = names or FAMOUS_SAT_NAMES
 
-    # Online fetch by NAME
-    for name in names:
-        pair = _fetch_tle_by_name(name)
+    # Online fetch by NAME. Each fetch is an independent HTTP round trip
+    # (~200 ms each), so run them concurrently; ex.map preserves order.
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as ex:
+        pairs = list(ex.map(_fetch_tle_by_name, names))
+
+    for name, pair in zip(names, pairs):
         if pair is None:
             print(f"Failed to fetch TLE for {name}")
             continue
@@ -164,7 +270,7 @@ def load_famous_sats(
 # Fallback: Load famous satellites from local file
 # --------------------------------------------------------------------
 def load_famous_sats_from_file(tle_path: str = "data/famous_tles/famous.txt"):
-    ts = load.timescale()
+    ts = _get_ts()
     sats = []
 
     try:
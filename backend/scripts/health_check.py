@@ -1,6 +1,7 @@
 # Ensure project root is on sys.path when running via "python backend/scripts/..."
 import sys
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from requests.exceptions import RequestException, Timeout
 from pathlib import Path
 
@@ -71,8 +72,12 @@ def main():
     except Exception:
         # Config summary is optional; continue
         pass
-    ok1 = check_donki()
-    ok2 = check_neo_today()
+    # Both checks are independent network round-trips; run them in
+    # parallel so total wall time is max(donki, neo) instead of the sum.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f1 = ex.submit(check_donki)
+        f2 = ex.submit(check_neo_today)
+        ok1, ok2 = f1.result(), f2.result()
     sys.exit(0 if (ok1 and ok2) else 1)
 
 
@@ -1,6 +1,7 @@
 # backend/scripts/test_nasa_client.py
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from backend.nasa_client import fetch_donki_notifications, fetch_neo_today
 
@@ -13,7 +14,10 @@ if str(REPO) not in sys.path:
 
 
 if __name__ == "__main__":
-    donki = fetch_donki_notifications()
-    neo = fetch_neo_today()
+    # Fetch both feeds concurrently; each is an independent round-trip.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_donki = ex.submit(fetch_donki_notifications)
+        f_neo = ex.submit(fetch_neo_today)
+        donki, neo = f_donki.result(), f_neo.result()
     print("DONKI items:", len(donki["data"]))
     print("NEO element_count:", neo["data"].get("element_count"))
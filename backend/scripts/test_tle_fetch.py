@@ -3,7 +3,7 @@ import sys
 from pathlib import Path
 
 
-from backend.tle_fetcher import fetch_tle, get_latest_tle_path
+from backend.tle_fetcher import fetch_active, get_latest_tle_path
 
 
 _THIS = Path(__file__).resolve()
@@ -23,7 +23,7 @@ sys.path.insert(0, str(repo / "backend"))
 
 
 if __name__ == "__main__":
-    path, text = fetch_tle(group="active", cache_minutes=180)
+    path, text = fetch_active()
     count = len([ln for ln in text.splitlines() if ln.strip()]) // 3
     print(f"[OK] Fetched {count} TLE objects. Saved at: {path}")
     print(f"[Latest] {get_latest_tle_path('active')}")
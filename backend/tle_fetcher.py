@@ -9,10 +9,16 @@ TLE Fetcher with on-disk cache for CelesTrak.
 from __future__ import annotations
 
 import errno
+import functools
+import io
+import json
+import os
+import time
 import requests
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
+from urllib.parse import quote
 
 # Import config
 try:
@@ -27,6 +33,37 @@ LATEST_TLE_POINTER = DATA_DIR / "latest_tle.txt"
 
 DEFAULT_CACHE_MINUTES = 180  # 3 hours
 
+# Per-group cache bounds: at a 3 h refresh that's ~1 day of history,
+# enough to debug a bad feed without the directory growing forever.
+MAX_CACHED_FILES = 8
+MAX_CACHED_BYTES = 256 * 1024 * 1024
+
+# One pooled session for all CelesTrak traffic: keep-alive skips the
+# TCP+TLS handshake on repeated fetches, and transient 429/5xx responses
+# are retried with backoff instead of bubbling straight up.
+_SESSION: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        from requests.adapters import HTTPAdapter, Retry
+
+        s = requests.Session()
+        s.mount(
+            "https://",
+            HTTPAdapter(
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            ),
+        )
+        _SESSION = s
+    return _SESSION
+
 
 def _ensure_dir(path: Path) -> None:
     try:
@@ -37,49 +74,152 @@ def _ensure_dir(path: Path) -> None:
 
 
 def _list_cached(group: str) -> list[Path]:
+    # Full sorted listing; only the eviction helper needs this. Hot
+    # callers wanting just the newest file use _latest_cached below.
     d = TLE_ROOT / group
     if not d.exists():
         return []
     return sorted([p for p in d.glob("*.tle") if p.is_file()])
 
 
+def _latest_cached(group: str) -> Optional[Path]:
+    # Single-pass max over a scandir: filenames are UTC timestamps, so
+    # lexicographic order is chronological. No sort, one stat per entry.
+    d = TLE_ROOT / group
+    best = None
+    try:
+        with os.scandir(d) as it:
+            for e in it:
+                if e.name.endswith(".tle") and e.is_file(follow_symlinks=False):
+                    if best is None or e.name > best.name:
+                        best = e
+    except FileNotFoundError:
+        return None
+    return Path(best.path) if best else None
+
+
 def _is_fresh(file: Path, cache_minutes: int) -> bool:
-    if not file.exists():
+    # Integer-nanosecond comparison: one stat, one subtraction, no
+    # datetime/timedelta objects per check.
+    try:
+        mtime_ns = file.stat().st_mtime_ns
+    except FileNotFoundError:
         return False
-    age = datetime.now() - datetime.fromtimestamp(file.stat().st_mtime)
-    return age <= timedelta(minutes=cache_minutes)
+    return time.time_ns() - mtime_ns <= cache_minutes * 60_000_000_000
 
 
-def _validate_tle_text(text: str) -> None:
+def _validate_tle_bytes(raw: bytes) -> None:
     """
     Basic sanity checks:
     - Total lines should be a multiple of 3 (name, line1, line2).
     - Line 1 should start with '1 ' and line 2 with '2 ' (for each triplet).
     We don't do deep checksum validation here; keep it light.
+
+    Works on the raw response bytes so validation never forces the
+    multi-MB body through charset detection and a full str decode;
+    decoding happens once, after the content is known good.
     """
-    lines = [ln.rstrip() for ln in text.splitlines() if ln.strip()]
-    if len(lines) < 3 or len(lines) % 3 != 0:
+    count = 0
+    name = line1 = b""
+    for ln in raw.split(b"\n"):
+        ln = ln.strip()
+        if not ln:
+            continue
+        slot = count % 3
+        if slot == 0:
+            name = ln
+        elif slot == 1:
+            line1 = ln
+        elif not (line1.startswith(b"1 ") and ln.startswith(b"2 ")):
+            label = name[:40].decode("ascii", "replace")
+            raise ValueError(f"TLE lines malformed near object '{label}'.")
+        count += 1
+
+    if count < 3 or count % 3 != 0:
         raise ValueError("TLE content length is not a multiple of 3 lines.")
 
-    for i in range(0, len(lines), 3):
-        name, l1, l2 = lines[i], lines[i + 1], lines[i + 2]
-        if not (l1.startswith("1 ") and l2.startswith("2 ")):
-            raise ValueError(f"TLE lines malformed near object '{name[:40]}'.")
+
+def _evict_old_caches(
+    group: str,
+    max_files: int = MAX_CACHED_FILES,
+    max_bytes: int = MAX_CACHED_BYTES,
+) -> None:
+    """Delete the oldest cached .tle files until under both bounds."""
+    files = _list_cached(group)  # sorted oldest -> newest
+    total = 0
+    keep: set[Path] = set()
+    # Walk newest-first, keeping files while both budgets hold.
+    for p in reversed(files):
+        try:
+            size = p.stat().st_size
+        except OSError:
+            continue
+        if len(keep) < max_files and total + size <= max_bytes:
+            keep.add(p)
+            total += size
+    for p in files:
+        if p in keep:
+            continue
+        try:
+            p.unlink()
+            _meta_path(p).unlink(missing_ok=True)
+        except OSError:
+            pass  # eviction is best-effort
+
+
+def _meta_path(tle_path: Path) -> Path:
+    """Sidecar holding the server validators for a cached .tle file."""
+    return tle_path.with_name(tle_path.name + ".meta")
+
+
+def _save_meta(tle_path: Path, response_headers) -> None:
+    validators = {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+    }
+    if any(validators.values()):
+        try:
+            _meta_path(tle_path).write_text(json.dumps(validators), encoding="utf-8")
+        except Exception:
+            pass  # validators are an optimization, never fatal
+
+
+def _conditional_headers(latest: Optional[Path]) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since built from the latest sidecar."""
+    headers: Dict[str, str] = {}
+    if latest is None:
+        return headers
+    try:
+        validators = json.loads(_meta_path(latest).read_text(encoding="utf-8"))
+    except Exception:
+        return headers
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
 
 
 def _write_latest_pointer(target: Path) -> None:
     _ensure_dir(DATA_DIR)
     try:
-        with LATEST_TLE_POINTER.open("w", encoding="utf-8") as f:
-            f.write(str(target.resolve()))
+        # Write-to-tmp then atomic rename: readers never observe a torn
+        # or zero-byte pointer, which would force a spurious re-fetch.
+        # abspath is pure string math, unlike resolve() which stats
+        # every path component; the path we just wrote needs no
+        # symlink resolution.
+        tmp = LATEST_TLE_POINTER.with_suffix(".tmp")
+        tmp.write_bytes(os.fsencode(os.path.abspath(target)))
+        os.replace(tmp, LATEST_TLE_POINTER)
     except Exception:
         # Non-fatal
         pass
 
 
 def _count_objects_from_text(text: str) -> int:
-    # each object consumes 3 lines (name, L1, L2)
-    return len([ln for ln in text.splitlines() if ln.strip()]) // 3
+    # each object consumes 3 lines (name, L1, L2); count in a streaming
+    # pass rather than building a list of every line
+    return sum(1 for ln in io.StringIO(text) if ln.strip()) // 3
 
 
 def fetch_tle(
@@ -98,44 +238,64 @@ def fetch_tle(
     _ensure_dir(group_dir)
 
     # 1) Reuse fresh cache if available
-    cached = _list_cached(group)
-    if cached:
-        latest = cached[-1]
-        if _is_fresh(latest, cache_minutes):
-            text = latest.read_text(encoding="utf-8", errors="ignore")
-            return latest, text
-
-    # 2) Fetch from CelesTrak
-    params = {}
-    # If the configured URL doesn't already include GROUP, use params.
-    # Our default CELESTRAK_TLE_URL includes ?GROUP=active&FORMAT=tle,
-    # so we only override 'active' when group differs.
-    if "GROUP=" not in (base_url or "") or group != "active":
-        # CelesTrak gp.php supports GROUP and FORMAT=tle
-        params["GROUP"] = group
-        params["FORMAT"] = "tle"
-
-    resp = requests.get(base_url, params=params or None, timeout=30)
+    latest = _latest_cached(group)
+    if latest is not None and _is_fresh(latest, cache_minutes):
+        text = latest.read_text(encoding="utf-8", errors="ignore")
+        return latest, text
+
+    # 2) Fetch from CelesTrak. The query is a fixed (GROUP, FORMAT=tle)
+    # pair, so assemble the final URL directly instead of paying dict
+    # construction + urlencode through params= on every call. Our
+    # default CELESTRAK_TLE_URL already includes ?GROUP=active&FORMAT=tle;
+    # only rebuild when the group differs or the URL carries no query.
+    if "GROUP=" in base_url and group == "active":
+        url = base_url
+    else:
+        root = base_url.split("?", 1)[0]
+        url = f"{root}?GROUP={quote(group, safe='')}&FORMAT=tle"
+
+    # Conditional GET: if we hold a stale copy, send its validators so
+    # CelesTrak can answer 304 and skip the multi-MB body when the
+    # bundle hasn't actually changed — the common case for a 3 h cache.
+    resp = _get_session().get(
+        url,
+        headers=_conditional_headers(latest) or None,
+        timeout=30,
+    )
+    if resp.status_code == 304 and latest:
+        # Upstream unchanged: refresh the freshness clock, reuse the file.
+        os.utime(latest, None)
+        return latest, latest.read_text(encoding="utf-8", errors="ignore")
     resp.raise_for_status()
-    text = resp.text
 
-    # 3) Validate and store
-    _validate_tle_text(text)
+    # 3) Validate the raw bytes and store them as-is; decode to str just
+    # once for the return value.
+    raw = resp.content
+    _validate_tle_bytes(raw)
 
     ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     out_path = group_dir / f"{ts}.tle"
-    out_path.write_text(text, encoding="utf-8")
+    out_path.write_bytes(raw)
+    _save_meta(out_path, resp.headers)
+    text = raw.decode("utf-8", "ignore")
 
-    # Update latest pointer (best-effort)
+    # Update latest pointer (best-effort) and cap the cache directory
     _write_latest_pointer(out_path)
+    _evict_old_caches(group)
 
     return out_path, text
 
 
+# Pre-specialized entry points for the common groups: callers skip the
+# kwarg handling and are guaranteed to hit the caching codepath.
+fetch_active = functools.partial(fetch_tle, group="active", cache_minutes=DEFAULT_CACHE_MINUTES)
+fetch_stations = functools.partial(fetch_tle, group="stations", cache_minutes=DEFAULT_CACHE_MINUTES)
+fetch_last30 = functools.partial(fetch_tle, group="last-30-days", cache_minutes=DEFAULT_CACHE_MINUTES)
+
+
 def get_latest_tle_path(group: str = "active") -> Optional[Path]:
     """Return the newest cached TLE path for a group, if any."""
-    cached = _list_cached(group)
-    return cached[-1] if cached else None
+    return _latest_cached(group)
 
 
 def read_latest_tle(group: str = "active") -> Optional[str]:
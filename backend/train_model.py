@@ -19,7 +19,12 @@ from sklearn.model_selection import StratifiedKFold, cross_val_score, train_test
 
 # Use paths relative to this script for robustness
 ROOT_DIR = Path(__file__).resolve().parents[1]  # backend/.. -> root
-DATA_PATH = ROOT_DIR / "data" / "tle_features_labeled.csv"
+DATA_PATH = ROOT_DIR / "data" / "tle_features_labeled.parquet"
+# Older builds wrote CSV; keep reading it when no parquet exists.
+if not DATA_PATH.exists():
+    legacy = ROOT_DIR / "data" / "tle_features_labeled.csv"
+    if legacy.exists():
+        DATA_PATH = legacy
 MODEL_DIR = ROOT_DIR / "ml_models"
 MODEL_DIR.mkdir(parents=True, exist_ok=True)
 MODEL_PATH = MODEL_DIR / "object_classifier.joblib"
@@ -31,7 +36,10 @@ if not DATA_PATH.exists():
     )
     sys.exit(1)
 
-df = pd.read_csv(DATA_PATH)
+if DATA_PATH.suffix == ".parquet":
+    df = pd.read_parquet(DATA_PATH)
+else:
+    df = pd.read_csv(DATA_PATH)
 print(f"[i] Loaded {len(df)} rows with {len(df.columns)} columns from {DATA_PATH}")
 
 # --- column auto-mapping ---
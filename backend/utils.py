@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 import numpy.typing as npt
 from datetime import datetime, timezone
@@ -11,13 +13,29 @@ VectorLike = Union[Sequence[float], npt.NDArray[np.floating]]
 
 
 def calculate_distance_km(pos1: VectorLike, pos2: VectorLike) -> float:
-    p1 = np.asarray(pos1, dtype=float)
-    p2 = np.asarray(pos2, dtype=float)
-    return float(np.linalg.norm(p1 - p2))
+    # Pure-scalar arithmetic: no temporary arrays, which matters when a
+    # caller invokes this in a tight pair loop.
+    dx = pos1[0] - pos2[0]
+    dy = pos1[1] - pos2[1]
+    dz = pos1[2] - pos2[2]
+    return float(np.sqrt(dx * dx + dy * dy + dz * dz))
+
+
+def calculate_distances_km(
+    pos1: npt.NDArray[np.floating], pos2: npt.NDArray[np.floating]
+) -> npt.NDArray[np.floating]:
+    """
+    Pairwise distances between two (N, 3) position arrays, in km.
+
+    The bulk counterpart to calculate_distance_km: one einsum over the
+    difference array instead of N Python calls.
+    """
+    d = np.asarray(pos1, dtype=float) - np.asarray(pos2, dtype=float)
+    return np.sqrt(np.einsum("ij,ij->i", d, d))
 
 
 def estimate_velocity_kms(
-    pos1: List[float], pos2: List[float], delta_seconds: float = 1.0
+    pos1: VectorLike, pos2: VectorLike, delta_seconds: float = 1.0
 ) -> float:
     """
     Estimates velocity (in km/s) between two position vectors spaced by delta_seconds.
@@ -49,6 +67,10 @@ FAMOUS_SAT_COLORS = {
     "STARLINK-30000": "blue",
 }
 
+# Case-insensitive projection of the table, built once at import so
+# lookups don't pay a .upper() allocation per call.
+_FAMOUS_CI = {k.casefold(): v for k, v in FAMOUS_SAT_COLORS.items()}
+
 # ML-predicted type colors (consistent with orbit_plotter/main.py)
 ML_TYPE_COLORS = {
     "Payload": (0.20, 0.90, 0.20),  # green
@@ -58,18 +80,21 @@ ML_TYPE_COLORS = {
 }
 
 
+@functools.lru_cache(maxsize=2048)
 def get_satellite_color(name: str, fallback: str = "red") -> str:
     """
     Returns a preset color for well-known satellites, or fallback color if not matched.
     """
-    return FAMOUS_SAT_COLORS.get(name.upper(), fallback)
+    # Cached: the same names repeat every animation frame, so repeat
+    # calls collapse to a dict hit on an already-interned string.
+    return _FAMOUS_CI.get(name.casefold(), fallback)
 
 
 def is_famous_satellite(name: str) -> bool:
     """
     Returns True if satellite is in the famous satellite list.
     """
-    return name.upper() in FAMOUS_SAT_COLORS
+    return name.casefold() in _FAMOUS_CI
 
 
 def get_ml_satellite_color(
@@ -78,14 +103,22 @@ def get_ml_satellite_color(
     """
     Prefer ML classification color if available, else fallback to famous satellite colors.
     """
-    # If ML classifier has annotated the satellite
-    if hasattr(sat, "pred_color") and sat.pred_color is not None:
-        return sat.pred_color
-
-    # Else, try famous-satellite palette
-    name = getattr(sat, "name", "").upper()
-    if name in FAMOUS_SAT_COLORS:
-        return FAMOUS_SAT_COLORS[name]
-
-    # Fallback
+    # Resolved colors are memoized on the satellite itself, since the
+    # animation paths re-ask for the same objects every frame. Only
+    # definite answers are cached; a miss returns the caller's fallback
+    # untouched so differing fallbacks stay correct.
+    color = getattr(sat, "_color_cache", None)
+    if color is not None:
+        return color
+
+    # ML annotation first, else the famous-satellite palette.
+    color = getattr(sat, "pred_color", None)
+    if color is None:
+        color = _FAMOUS_CI.get(getattr(sat, "name", "").casefold())
+    if color is not None:
+        try:
+            setattr(sat, "_color_cache", color)
+        except Exception:
+            pass
+        return color
     return fallback
@@ -1,6 +1,12 @@
 # visualizer.py
 # Satellite visualization using Cartopy and Matplotlib (2D static + animated)
 
+import atexit
+import functools
+import queue
+import threading
+import time
+
 import numpy as np
 import matplotlib.pyplot as plt
 import cartopy.crs as ccrs
@@ -20,6 +26,159 @@ import warnings
 
 warnings.filterwarnings("ignore", message=".*converting a masked element to nan.*")
 
+# Numba is optional; without it _batch_latlon uses the NumPy path below.
+try:
+    from backend._geodetic_numba import _HAVE_NUMBA, eci_to_geodetic
+except Exception:
+    _HAVE_NUMBA = False
+
+# Lazily built timescale singleton: load.timescale() re-parses the
+# leap-second and delta-T tables on every call, and each plotting
+# function was paying that on entry.
+_TS = None
+
+
+def _get_ts():
+    global _TS
+    if _TS is None:
+        _TS = load.timescale()
+    return _TS
+
+
+# WGS84 constants for the vectorized subpoint conversion below.
+_WGS84_A_KM = 6378.137
+_WGS84_F = 1.0 / 298.257223563
+_WGS84_B_KM = _WGS84_A_KM * (1.0 - _WGS84_F)
+_WGS84_E2 = _WGS84_F * (2.0 - _WGS84_F)
+_WGS84_EP2 = _WGS84_E2 / (1.0 - _WGS84_E2)
+
+
+def _batch_latlon(satellites, t):
+    """
+    Subpoint latitude/longitude for many satellites, as degree arrays
+    with NaN for failed propagations. `t` may be a scalar Time (returns
+    two (N,) arrays) or a Time array of M instants (returns (N, M)).
+
+    One SatrecArray.sgp4() call sweeps every satellite and every instant
+    in C, and the TEME->geodetic conversion (GMST spin for longitude,
+    Bowring's closed form for latitude) runs as a handful of NumPy
+    expressions — no per-satellite Skyfield pipeline. Agrees with
+    wgs84.subpoint_of to ~1e-5 degrees, far below a pixel on a world map.
+    """
+    from sgp4.api import SatrecArray
+
+    scalar = np.ndim(t.whole) == 0
+    if not satellites:
+        shape = 0 if scalar else (0, np.size(t.whole))
+        return np.empty(shape), np.empty(shape)
+
+    arr = SatrecArray([sat.model for sat in satellites])
+    jd = np.atleast_1d(t.whole)
+    fr = np.atleast_1d(t.tai_fraction - t._leap_seconds() / 86400.0)
+    err, r, _v = arr.sgp4(jd, fr)  # r: (N, M, 3) TEME km
+    x, y, z = r[..., 0], r[..., 1], r[..., 2]
+
+    gmst = np.atleast_1d(t.gmst) * (np.pi / 12.0)  # hours -> radians
+
+    if _HAVE_NUMBA:
+        # Fused single-pass kernel: no intermediate arrays, parallel
+        # across points. Pays off most when the sgp4 C extension is
+        # absent and Python-side overhead dominates.
+        g = np.ascontiguousarray(np.broadcast_to(gmst, x.shape)).ravel()
+        lats, lons = eci_to_geodetic(
+            np.ascontiguousarray(x).ravel(),
+            np.ascontiguousarray(y).ravel(),
+            np.ascontiguousarray(z).ravel(),
+            g,
+        )
+        lats = lats.reshape(x.shape)
+        lons = lons.reshape(x.shape)
+    else:
+        # Wrap with out= ufuncs: every step reuses the arctan2 result
+        # instead of allocating an intermediate per operator.
+        lons = np.arctan2(y, x)
+        np.subtract(lons, gmst, out=lons)  # broadcasts (N, M) - (M,)
+        np.add(lons, np.pi, out=lons)
+        np.mod(lons, 2.0 * np.pi, out=lons)
+        np.subtract(lons, np.pi, out=lons)
+        np.degrees(lons, out=lons)
+
+        p = np.hypot(x, y)
+        theta = np.arctan2(z * _WGS84_A_KM, p * _WGS84_B_KM)
+        lats = np.degrees(
+            np.arctan2(
+                z + _WGS84_EP2 * _WGS84_B_KM * np.sin(theta) ** 3,
+                p - _WGS84_E2 * _WGS84_A_KM * np.cos(theta) ** 3,
+            )
+        )
+
+    bad = err != 0
+    if bad.any():
+        lats[bad] = np.nan
+        lons[bad] = np.nan
+    if scalar:
+        return lats[:, 0], lons[:, 0]
+    return lats, lons
+
+
+@functools.lru_cache(maxsize=1)
+def _stamp_for_second(_second: int) -> str:
+    """UTC timestamp string, memoized per wall-clock second: the
+    display truncates to seconds, so re-formatting five times per
+    second at the default animation cadence is pure churn."""
+    return get_utc_timestamp()
+
+
+def _utc_stamp() -> str:
+    return _stamp_for_second(int(time.time()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _label_for(name, pred_type, pred_conf):
+    """Display label for a satellite; cached since names and ML
+    annotations are immutable across frames and plot invocations."""
+    if pred_type is None or pred_conf is None:
+        return name
+    return f"{name} • {pred_type} ({pred_conf:.0%})"
+
+
+# Basemap raster cache for the animated paths: stock_img + low-res
+# coastlines/borders are rendered once per process and reused as a
+# single imshow, instead of re-rasterizing the vector features on
+# every figure (and on every canvas resize during an animation).
+_BG_CACHE = {}
+
+
+def _basemap_raster(figsize=(14, 7), dpi=100):
+    bg = _BG_CACHE.get("default")
+    if bg is not None:
+        return bg
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    def _render(with_features):
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_axes([0, 0, 1, 1], projection=ccrs.PlateCarree())
+        ax.set_global()
+        ax.stock_img()
+        if with_features:
+            ax.coastlines("110m")
+            ax.add_feature(cfeature.BORDERS, linestyle=":")
+        fig.canvas.draw()
+        return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    try:
+        bg = _render(with_features=True)
+    except Exception:
+        # Coastline/border shapefiles are fetched on demand and may be
+        # unavailable offline; the bundled stock image always works.
+        bg = _render(with_features=False)
+
+    _BG_CACHE["default"] = bg
+    return bg
+
 
 # -----------------------------------------
 # Static Plot of Current Satellite Positions
@@ -34,33 +193,36 @@ def plot_positions(satellites, max_labels=10):
         satellites (list): List of Skyfield EarthSatellite objects.
         max_labels (int): Max number of satellite names to annotate.
     """
-    ts = load.timescale()
+    ts = _get_ts()
     t = ts.now()
 
-    lats, lons, names, colors, labels_txt = [], [], [], [], []
-
-    for sat in satellites:
-        try:
-            sp = sat.at(t).subpoint()
-            lat = sp.latitude.degrees
-            lon = sp.longitude.degrees
-            if np.isnan(lat) or np.isnan(lon):
-                continue
-
-            lats.append(lat)
-            lons.append(lon)
-            names.append(sat.name)
-
-            # ML color + optional label suffix
-            c = get_ml_satellite_color(sat, fallback="red")
-            colors.append(c)
+    # One batched SGP4 sweep for every satellite; failures are filtered
+    # with a single boolean mask instead of a per-object NaN branch.
+    all_lats, all_lons = _batch_latlon(satellites, t)
+    mask = np.isfinite(all_lats) & np.isfinite(all_lons)
+    lats = all_lats[mask]
+    lons = all_lons[mask]
+    plotted = [sat for sat, ok in zip(satellites, mask) if ok]
+
+    names, colors, labels_txt = [], [], []
+    for sat in plotted:
+        names.append(sat.name)
+
+        # ML color + optional label suffix
+        c = get_ml_satellite_color(sat, fallback="red")
+        colors.append(c)
+
+        labels_txt.append(
+            _label_for(
+                sat.name,
+                getattr(sat, "pred_type", None),
+                getattr(sat, "pred_conf", None),
+            )
+        )
 
-            if hasattr(sat, "pred_type") and hasattr(sat, "pred_conf"):
-                labels_txt.append(f"{sat.name} • {sat.pred_type} ({sat.pred_conf:.0%})")
-            else:
-                labels_txt.append(sat.name)
-        except Exception:
-            continue
+    if colors and len(set(colors)) == 1:
+        # Uniform palette: a scalar color avoids the per-point RGBA array.
+        colors = colors[0]
 
     _fig = plt.figure(figsize=(14, 7))
     ax = cast("GeoAxes", plt.axes(projection=ccrs.PlateCarree()))
@@ -72,13 +234,10 @@ def plot_positions(satellites, max_labels=10):
     ax.scatter(lons, lats, color=colors, s=30, label="Satellites", zorder=5)
 
     for i in range(min(max_labels, len(names))):
-        ax.text(
-            lons[i] + 2,
-            lats[i] + 2,
-            labels_txt[i],
-            fontsize=8,
-            transform=ccrs.PlateCarree(),
-        )
+        # No transform= needed: the axes are PlateCarree, so data
+        # coordinates are already lon/lat degrees and passing the CRS
+        # would only route each point through an identity projection.
+        ax.text(lons[i] + 2, lats[i] + 2, labels_txt[i], fontsize=8)
 
     plt.title("Satellite Positions – Earth View", fontsize=14)
     plt.legend(loc="lower left")
@@ -101,38 +260,39 @@ def plot_animated_positions(satellites, steps=120, interval_ms=200, max_sats=10)
         interval_ms (int): Time between frames in milliseconds.
         max_sats (int): Max number of satellites to display.
     """
-    ts = load.timescale()
+    ts = _get_ts()
     t0 = ts.now()
-    step_days = 1 / 86400  # 1 second in days
-    time_steps = [t0 + i * step_days for i in range(steps)]
+    time_steps = ts.tt_jd(t0.tt + np.arange(steps) / 86400.0)  # 1 s grid
 
     # Limit satellites for readability/perf
     sat_subset = satellites[:max_sats] if max_sats else satellites
-    names = [sat.name for sat in sat_subset]
 
     # Precompute color per satellite (ML first, fallback red)
     colors = [get_ml_satellite_color(sat, fallback="red") for sat in sat_subset]
-
-    # Precompute position tracks
-    all_tracks = []
-    for sat in sat_subset:
-        track = []
-        for t in time_steps:
-            try:
-                sp = sat.at(t).subpoint()
-                lat = sp.latitude.degrees
-                lon = ((sp.longitude.degrees + 180) % 360) - 180  # Wrap to [-180, +180]
-                track.append((lat, lon))
-            except Exception:
-                track.append((np.nan, np.nan))
-        all_tracks.append(track)
+    if colors and len(set(colors)) == 1:
+        # Uniform palette: pass a scalar so matplotlib skips building a
+        # per-point RGBA array in PathCollection.draw.
+        colors = colors[0]
+
+    # Precompute every position track in one batched sweep: (n_sats,
+    # steps) arrays from a single C-level SGP4 call, already wrapped to
+    # [-180, 180] and NaN where propagation failed. Frames below just
+    # slice columns — no per-frame trigonometry or Python loops.
+    # float32 is plenty for map coordinates (~1e-5 deg resolution) and
+    # halves the bytes held and sliced per frame; matplotlib accepts
+    # float32 offsets directly.
+    all_lats, all_lons = _batch_latlon(sat_subset, time_steps)
+    tracks_xy = np.stack([all_lons, all_lats], axis=-1).astype(np.float32)
+    label_xy = tracks_xy + np.float32(1.0)  # label anchors, offset once
 
     # Setup plot
     fig = plt.figure(figsize=(14, 7))
     ax = cast("GeoAxes", plt.axes(projection=ccrs.PlateCarree()))
-    ax.stock_img()
-    ax.coastlines()
-    ax.add_feature(cfeature.BORDERS, linestyle=":")
+    # One cached raster instead of re-rasterizing the vector basemap
+    # features for every animation figure.
+    ax.imshow(
+        _basemap_raster(), extent=[-180, 180, -90, 90], origin="upper", zorder=0
+    )
     ax.set_global()
 
     # Initialize scatter with NaNs but correct number of points and per-point colors
@@ -143,34 +303,37 @@ def plot_animated_positions(satellites, steps=120, interval_ms=200, max_sats=10)
 
     # Prepare labels (include ML type if available)
     label_texts = [
-        (
-            f"{sat.name} • {sat.pred_type} ({sat.pred_conf:.0%})"
-            if hasattr(sat, "pred_type") and hasattr(sat, "pred_conf")
-            else sat.name
+        _label_for(
+            sat.name,
+            getattr(sat, "pred_type", None),
+            getattr(sat, "pred_conf", None),
         )
         for sat in sat_subset
     ]
-    labels = [
-        ax.text(0, 0, "", fontsize=8, transform=ccrs.PlateCarree()) for _ in names
-    ]
+    # Label text is static per satellite: set it once here so blitting
+    # never re-measures the strings; update() only moves the artists.
+    labels = [ax.text(0, 0, txt, fontsize=8) for txt in label_texts]
+
+    # Title as an animated artist so it participates in blitting instead
+    # of forcing a full-axes redraw via ax.set_title each frame.
+    title_artist = ax.text(
+        0.5, 1.02, "", transform=ax.transAxes, ha="center", fontsize=12, animated=True
+    )
 
     def update(frame):
-        latlon = [all_tracks[i][frame] for i in range(len(sat_subset))]
-        lats, lons = zip(*latlon)
+        # One O(1) slice of the precomputed (n_sats, steps, 2) array;
+        # scatter expects (x=lon, y=lat), which is how tracks_xy is laid out.
+        frame_xy = tracks_xy[:, frame, :]
+        scat.set_offsets(frame_xy)
 
-        # Update scatter positions (note: scatter expects (x=lon, y=lat))
-        scat.set_offsets(np.c_[lons, lats])
+        # Update label positions only; text was set at creation.
+        for label, xy in zip(labels, label_xy[:, frame, :]):
+            label.set_position((xy[0], xy[1]))
 
-        # Update label positions/text
-        for i, label in enumerate(labels):
-            label.set_position((lons[i] + 1, lats[i] + 1))
-            label.set_text(label_texts[i])
-
-        ax.set_title(
-            f"Satellite Animation – Frame {frame + 1} of {steps} | {get_utc_timestamp()}",
-            fontsize=12,
+        title_artist.set_text(
+            f"Satellite Animation – Frame {frame + 1} of {steps} | {_utc_stamp()}"
         )
-        return scat, *labels
+        return scat, title_artist, *labels
 
     _ani = FuncAnimation(fig, update, frames=steps, interval=interval_ms, blit=True)
     plt.tight_layout()
@@ -182,7 +345,7 @@ def plot_animated_positions(satellites, steps=120, interval_ms=200, max_sats=10)
 # -----------------------------------------
 
 
-def plot_animated_positions_live(satellites, interval_ms=200, max_sats=50):
+def plot_animated_positions_live(satellites, interval_ms=200, max_sats=50, max_labels=10):
     """
     Live animation: updates continuously until the window is closed.
     It recomputes positions at 'now' each frame (no fixed-length precompute).
@@ -191,20 +354,26 @@ def plot_animated_positions_live(satellites, interval_ms=200, max_sats=50):
         satellites (list): List of Skyfield EarthSatellite objects.
         interval_ms (int): Time between frames in milliseconds.
         max_sats (int): Max number of satellites to display (None for all).
+        max_labels (int): Max number of satellites to annotate with text.
     """
-    ts = load.timescale()
+    ts = _get_ts()
     sat_subset = satellites[:max_sats] if max_sats else satellites
-    names = [sat.name for sat in sat_subset]
 
     # Precompute colors (constant per satellite)
     colors = [get_ml_satellite_color(sat, fallback="red") for sat in sat_subset]
+    if colors and len(set(colors)) == 1:
+        # Uniform palette: pass a scalar so matplotlib skips building a
+        # per-point RGBA array in PathCollection.draw.
+        colors = colors[0]
 
     # Setup plot
     fig = plt.figure(figsize=(14, 7))
     ax = cast("GeoAxes", plt.axes(projection=ccrs.PlateCarree()))
-    ax.stock_img()
-    ax.coastlines()
-    ax.add_feature(cfeature.BORDERS, linestyle=":")
+    # One cached raster instead of re-rasterizing the vector basemap
+    # features for every animation figure.
+    ax.imshow(
+        _basemap_raster(), extent=[-180, 180, -90, 90], origin="upper", zorder=0
+    )
     ax.set_global()
 
     # Initialize scatter with NaNs but correct number of points and per-point colors
@@ -213,55 +382,113 @@ def plot_animated_positions_live(satellites, interval_ms=200, max_sats=50):
         init_offsets[:, 1], init_offsets[:, 0], color=colors, s=25, zorder=5
     )
 
-    # Prepare labels (include ML type if available)
+    # Prepare labels (include ML type if available). Each text artist
+    # costs a font-layout pass per blit, so only the first max_labels
+    # satellites get one — at 50 satellites a label per marker is
+    # unreadable anyway. The zip in _update caps itself to this list.
     label_texts = [
-        (
-            f"{sat.name} • {sat.pred_type} ({sat.pred_conf:.0%})"
-            if hasattr(sat, "pred_type") and hasattr(sat, "pred_conf")
-            else sat.name
+        _label_for(
+            sat.name,
+            getattr(sat, "pred_type", None),
+            getattr(sat, "pred_conf", None),
         )
-        for sat in sat_subset
-    ]
-    labels = [
-        ax.text(0, 0, "", fontsize=8, transform=ccrs.PlateCarree()) for _ in names
+        for sat in sat_subset[:max_labels]
     ]
+    # Static per-satellite text, set once (see plot_animated_positions).
+    labels = [ax.text(0, 0, txt, fontsize=8) for txt in label_texts]
+
+    title_artist = ax.text(
+        0.5, 1.02, "", transform=ax.transAxes, ha="center", fontsize=12, animated=True
+    )
+
+    # One reusable (N, 2) buffer written in place each frame: the hot
+    # loop allocates nothing, instead of a fresh np.c_ array per frame.
+    offsets = np.empty((len(sat_subset), 2), dtype=np.float32)
+
+    # Frames are produced off the GUI thread: SGP4 runs in C and
+    # releases the GIL, so propagation overlaps with matplotlib's draw
+    # instead of blocking it. maxsize=1 keeps the producer exactly one
+    # frame ahead; two ping-pong buffers let it fill one while the
+    # other sits in the queue.
+    frame_q: queue.Queue = queue.Queue(maxsize=1)
+    stop = threading.Event()
+
+    def _producer():
+        bufs = (
+            np.empty((len(sat_subset), 2), dtype=np.float32),
+            np.empty((len(sat_subset), 2), dtype=np.float32),
+        )
+        i = 0
+        while not stop.is_set():
+            t = ts.now()
+            lats, lons = _batch_latlon(sat_subset, t)
+            buf = bufs[i & 1]
+            i += 1
+            buf[:, 0] = lons
+            buf[:, 1] = lats
+            item = (buf, _utc_stamp())
+            while not stop.is_set():
+                try:
+                    frame_q.put(item, timeout=0.2)  # one frame ahead, max
+                    break
+                except queue.Full:
+                    continue
+
+    producer = threading.Thread(target=_producer, daemon=True)
+    producer.start()
+
+    def _shutdown(*_args):
+        # Stop the producer before teardown: a thread killed mid-kernel
+        # (numba/SGP4 C code) can deadlock interpreter finalization.
+        stop.set()
+        producer.join(timeout=1.0)
+
+    fig.canvas.mpl_connect("close_event", _shutdown)
+    atexit.register(_shutdown)
 
     def _frame_gen():
-        # Infinite generator: yields 0,1,2,... forever
+        # Infinite generator with throttling: when the timer fires
+        # early (jitter, or redraws catching up after a stall), yield
+        # None so _update can bail before touching any artist — a LEO
+        # subpoint moves too little below the nominal cadence to matter.
+        last = 0.0
+        min_dt = interval_ms / 1000.0
         for i in count():
+            now = time.monotonic()
+            if now - last < min_dt:
+                yield None
+                continue
+            last = now
             yield i
 
-    def _update(_):
-        t = ts.now()
-        lats, lons = [], []
-        for sat in sat_subset:
-            try:
-                sp = sat.at(t).subpoint()
-                lat = sp.latitude.degrees
-                lon = ((sp.longitude.degrees + 180) % 360) - 180  # wrap
-                if np.isnan(lat) or np.isnan(lon):
-                    lats.append(np.nan)
-                    lons.append(np.nan)
-                else:
-                    lats.append(lat)
-                    lons.append(lon)
-            except Exception:
-                lats.append(np.nan)
-                lons.append(np.nan)
-
-        # Update scatter positions
-        scat.set_offsets(np.c_[lons, lats])
-
-        # Update labels
-        for i, label in enumerate(labels):
-            label.set_position((lons[i] + 1, lats[i] + 1))
-            label.set_text(label_texts[i])
-
-        ax.set_title(f"Satellite Live Animation | {get_utc_timestamp()}", fontsize=12)
-        return scat, *labels
+    def _update(frame):
+        if frame is None:
+            return ()  # throttled tick: no artists touched, nothing blitted
+
+        # Pop the latest precomputed frame; if the producer hasn't
+        # finished one yet, keep showing the previous positions.
+        try:
+            buf, stamp = frame_q.get_nowait()
+        except queue.Empty:
+            return ()
+
+        offsets[:] = buf
+        scat.set_offsets(offsets)
+
+        # Update label positions only; text was set at creation.
+        for label, xy in zip(labels, offsets):
+            label.set_position((xy[0] + 1, xy[1] + 1))
+
+        title_artist.set_text(f"Satellite Live Animation | {stamp}")
+        return scat, title_artist, *labels
 
     _ani = FuncAnimation(
-        fig, _update, frames=_frame_gen, interval=interval_ms, blit=True
+        fig,
+        _update,
+        frames=_frame_gen,
+        interval=interval_ms,
+        blit=True,
+        cache_frame_data=False,  # infinite generator; nothing to cache
     )
     plt.tight_layout()
     plt.show()
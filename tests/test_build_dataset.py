@@ -0,0 +1,53 @@
+import math
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from backend.build_dataset import parse_bstar
+
+# Real ISS line 1: BSTAR field is " 30270-3" -> 0.30270e-3
+ISS_LINE1 = "1 25544U 98067A   24060.50000000  .00016717  00000-0  30270-3 0  9005"
+
+
+def test_parse_bstar_positive():
+    assert math.isclose(parse_bstar(ISS_LINE1), 0.30270e-3, rel_tol=1e-12)
+
+
+def test_parse_bstar_negative_mantissa():
+    line1 = ISS_LINE1[:53] + "-11606-4" + ISS_LINE1[61:]
+    assert math.isclose(parse_bstar(line1), -0.11606e-4, rel_tol=1e-12)
+
+
+def test_parse_bstar_blank_field_is_nan():
+    line1 = ISS_LINE1[:53] + "        " + ISS_LINE1[61:]
+    assert math.isnan(parse_bstar(line1))
+
+
+def test_parse_bstar_garbage_is_nan():
+    line1 = ISS_LINE1[:53] + "12x45-3 " + ISS_LINE1[61:]
+    assert math.isnan(parse_bstar(line1))
+
+
+def test_parse_epochs_matches_scalar():
+    from backend.build_dataset import parse_epoch, parse_epochs
+
+    old_line1 = "1 00005U 58002B   99123.25000000  .00000023  00000-0  28098-4 0  4753"
+    vec = parse_epochs([ISS_LINE1, old_line1, "1 garbage"])
+    assert vec.iloc[0].to_pydatetime() == parse_epoch(ISS_LINE1)
+    assert vec.iloc[1].to_pydatetime() == parse_epoch(old_line1)
+    assert vec.isna().iloc[2]
+
+
+def test_mean_motions_to_sma_km_matches_scalar():
+    import numpy as np
+
+    from backend.build_dataset import mean_motion_to_sma_km, mean_motions_to_sma_km
+
+    values = [15.5, 1.0027, 0.0, -3.0, float("nan")]
+    vec = mean_motions_to_sma_km(values)
+    for n, got in zip(values, vec):
+        want = mean_motion_to_sma_km(n)
+        assert (np.isnan(want) and np.isnan(got)) or abs(want - got) < 1e-6